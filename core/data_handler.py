@@ -7,7 +7,7 @@ import logging
 import re
 import base64
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TextIO
 
 from .crypto import CryptoHandler
 from .importers import parse_google_chrome, GOOGLE_CHROME_HEADER, parse_samsung_pass
@@ -63,6 +63,38 @@ class DataHandler:
         """
         导出为CSV文件，并提供一个选项来决定是否包含TOTP密钥。
         """
+        output = io.StringIO()
+        DataHandler.write_csv(entries, output, include_totp)
+        return output.getvalue()
+
+    @staticmethod
+    def export_to_csv_file(
+        entries: List[Dict[str, Any]], file_path: str, include_totp: bool = False
+    ) -> None:
+        """
+        将条目逐行直接写入CSV文件，不在内存中拼接完整的CSV字符串。
+        先写入临时文件，全部成功后再原子地替换目标文件，
+        中途出错时不会留下写了一半的文件，也不会破坏已存在的同名文件。
+        """
+        temp_path = file_path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8", newline="") as f:
+                DataHandler.write_csv(entries, f, include_totp)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    @staticmethod
+    def write_csv(
+        entries: List[Dict[str, Any]], output: TextIO, include_totp: bool = False
+    ) -> None:
+        """
+        将条目以CSV格式写入任意文本流。
+        """
         BASE_FIELDNAMES: List[str] = [
             "name",
             "username",
@@ -81,7 +113,6 @@ class DataHandler:
             f"Preparing to export {len(entries)} entries to CSV. Include TOTP: {include_totp}"
         )
         try:
-            output = io.StringIO()
             writer = csv.DictWriter(output, fieldnames=fieldnames)
             writer.writeheader()
             for entry in entries:
@@ -108,7 +139,6 @@ class DataHandler:
                     else:
                         row["totp"] = ""
                 writer.writerow(row)
-            return output.getvalue()
         except Exception as e:
             logger.error(f"Error during CSV export: {e}", exc_info=True)
             raise
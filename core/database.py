@@ -218,12 +218,14 @@ class DataManager:
             return False
         try:
             self.cursor.execute("BEGIN")
-            for entry in decrypted_entries:
-                new_encrypted_data: str = self.crypto.encrypt(entry["json_data"])
-                self.cursor.execute(
-                    "UPDATE details SET data = ? WHERE entry_id = ?",
-                    (new_encrypted_data, entry["id"]),
-                )
+            # 所有条目在同一事务中通过一次 executemany 批量更新
+            self.cursor.executemany(
+                "UPDATE details SET data = ? WHERE entry_id = ?",
+                (
+                    (self.crypto.encrypt(entry["json_data"]), entry["id"])
+                    for entry in decrypted_entries
+                ),
+            )
             self.conn.commit()
             return True
         except Exception as e:
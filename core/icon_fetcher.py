@@ -47,29 +47,39 @@ class IconFetcher:
         "https://icons.duckduckgo.com/ip3/{domain}.ico",
     ]
 
+    # 默认图标在首次使用时渲染一次，之后在整个进程中复用，
+    # 避免每次选中没有图标的条目时都重新解析和光栅化SVG。
+    _raw_default_pixmap: QPixmap | None = None
+    _default_pixmap: QPixmap | None = None
+
     @staticmethod
     def _get_raw_default_pixmap() -> QPixmap:
         """从SVG字符串渲染并返回一个 *原始的、未经处理的* QPixmap默认图标。"""
-        renderer = QSvgRenderer(IconFetcher.DEFAULT_ICON_SVG_STRING.encode("utf-8"))
-        pixmap = QPixmap(
-            QSize(IconFetcher.TARGET_ICON_SIZE, IconFetcher.TARGET_ICON_SIZE)
-        )
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        renderer.render(painter)
-        painter.end()
-        return pixmap
+        if IconFetcher._raw_default_pixmap is None:
+            renderer = QSvgRenderer(
+                IconFetcher.DEFAULT_ICON_SVG_STRING.encode("utf-8")
+            )
+            pixmap = QPixmap(
+                QSize(IconFetcher.TARGET_ICON_SIZE, IconFetcher.TARGET_ICON_SIZE)
+            )
+            pixmap.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(pixmap)
+            renderer.render(painter)
+            painter.end()
+            IconFetcher._raw_default_pixmap = pixmap
+        return IconFetcher._raw_default_pixmap
 
     @staticmethod
     def get_default_pixmap() -> QPixmap:
         """获取一个 *经过圆形处理的* 默认图标。"""
-        raw_pixmap = IconFetcher._get_raw_default_pixmap()
-        return IconProcessor.circle_mask(
-            raw_pixmap,
-            IconFetcher.TARGET_ICON_SIZE,
-            IconFetcher.BORDER_WIDTH,
-            IconFetcher.BORDER_COLOR,
-        )
+        if IconFetcher._default_pixmap is None:
+            IconFetcher._default_pixmap = IconProcessor.circle_mask(
+                IconFetcher._get_raw_default_pixmap(),
+                IconFetcher.TARGET_ICON_SIZE,
+                IconFetcher.BORDER_WIDTH,
+                IconFetcher.BORDER_COLOR,
+            )
+        return IconFetcher._default_pixmap
 
     @staticmethod
     def get_default_icon_base64() -> str | None:
@@ -99,23 +109,28 @@ class IconFetcher:
         从Base64字符串创建 QPixmap，并自动应用圆形遮罩和边框。
         如果输入为空或无效，则返回处理过的默认图标。
         """
-        raw_pixmap = QPixmap()
+        if not base64_str:
+            return IconFetcher.get_default_pixmap()
+        return IconFetcher._decode_circle_pixmap(base64_str)
 
-        if base64_str:
-            try:
-                byte_array = QByteArray.fromBase64(base64_str.encode("utf-8"))
-                if not raw_pixmap.loadFromData(byte_array):
-                    logger.warning(
-                        "Failed to load pixmap from byte array, data might be corrupt. Falling back to default."
-                    )
-                    raw_pixmap = IconFetcher._get_raw_default_pixmap()
-            except Exception as e:
+    # 同一个图标在列表重建、搜索和切换条目时会被反复请求，
+    # 这里按Base64字符串缓存解码并圆形化后的结果，每个唯一图标只处理一次。
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _decode_circle_pixmap(base64_str: str) -> QPixmap:
+        raw_pixmap = QPixmap()
+        try:
+            byte_array = QByteArray.fromBase64(base64_str.encode("utf-8"))
+            if not raw_pixmap.loadFromData(byte_array):
                 logger.warning(
-                    f"Failed to create QPixmap from Base64: {e}. Falling back to default."
+                    "Failed to load pixmap from byte array, data might be corrupt. Falling back to default."
                 )
-                raw_pixmap = IconFetcher._get_raw_default_pixmap()
-        else:
-            raw_pixmap = IconFetcher._get_raw_default_pixmap()
+                return IconFetcher.get_default_pixmap()
+        except Exception as e:
+            logger.warning(
+                f"Failed to create QPixmap from Base64: {e}. Falling back to default."
+            )
+            return IconFetcher.get_default_pixmap()
 
         return IconProcessor.circle_mask(
             raw_pixmap,
@@ -127,6 +142,12 @@ class IconFetcher:
     @staticmethod
     def icon_from_base64(base64_str: str | None) -> QIcon:
         """从Base64字符串创建 QIcon (其内部的pixmap已是圆形)。"""
+        return IconFetcher._icon_for(base64_str or "")
+
+    # 侧边栏每次重建分类按钮都会请求同样的图标，QIcon 同样按输入字符串缓存
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _icon_for(base64_str: str) -> QIcon:
         return QIcon(IconFetcher.pixmap_from_base64(base64_str))
 
     # --- MODIFICATION START: New private method with LRU cache ---
@@ -1,7 +1,7 @@
 # language/manager.py
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterable
 
 # 动态导入语言环境文件
 from .locales import en, zh_CN
@@ -57,6 +57,13 @@ class LanguageManager:
                 )
                 return key
 
+    def snapshot(self, keys: Iterable[str]) -> Dict[str, str]:
+        """
+        一次性解析一组键，返回普通字典。适合在语言切换时把一个界面
+        需要的所有文本预先取出，之后直接按键读取。
+        """
+        return {key: self.get(key) for key in keys}
+
     def get_available_languages(self) -> Dict[str, str]:
         """返回所有可用语言的代码和显示名称的字典。"""
         return {"en": "English", "zh_CN": "简体中文"}
@@ -11,6 +11,7 @@ from PyQt6.QtGui import QImageReader, QIcon
 from config import APP_LOG_DIR, load_settings
 from language import t
 from utils import icon_cache
+from ui.task_manager import task_manager
 from utils.paths import resource_path
 
 
@@ -66,7 +67,7 @@ def main():
         logger.critical(f"Failed to load settings or set language: {e}", exc_info=True)
         t.set_language("zh_CN")
 
-    icon_cache.preload()
+    icon_cache.preload(task_manager.run_in_background)
 
     from app import SafeKeyApp
 
@@ -9,7 +9,14 @@ from PyQt6.QtWidgets import (
     QStyleOption,
     QStyle,
 )
-from PyQt6.QtGui import QIcon, QMouseEvent, QPaintEvent, QPainter, QEnterEvent
+from PyQt6.QtGui import (
+    QIcon,
+    QPixmap,
+    QMouseEvent,
+    QPaintEvent,
+    QPainter,
+    QEnterEvent,
+)
 from PyQt6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve, QEvent, pyqtSignal
 
 
@@ -20,9 +27,11 @@ class AnimatedBookmarkButton(QWidget):
 
     clicked = pyqtSignal()
 
+    ICON_SIZE = QSize(22, 22)
+
     def __init__(
         self,
-        icon_source: Union[QIcon, str],
+        icon_source: Union[QIcon, QPixmap, str],
         text: str,
         parent: Optional[QWidget] = None,
     ):
@@ -37,10 +46,7 @@ class AnimatedBookmarkButton(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
 
         self.icon_label = QLabel(self)
-        icon = (
-            icon_source if isinstance(icon_source, QIcon) else QIcon(str(icon_source))
-        )
-        self.icon_label.setPixmap(icon.pixmap(QSize(22, 22)))
+        self.set_icon(icon_source)
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.icon_label.setGeometry(5, 0, 40, 40)
 
@@ -63,6 +69,19 @@ class AnimatedBookmarkButton(QWidget):
         )
         self.opacity_animation.setDuration(150)
 
+    def set_icon(self, icon_source: Union[QIcon, QPixmap, str]) -> None:
+        """更换按钮图标，按钮复用时无需重新创建整个控件。"""
+        if isinstance(icon_source, QPixmap):
+            # 已经按正确尺寸光栅化好的图像（例如来自 icon_cache.get_pixmap）
+            self.icon_label.setPixmap(icon_source)
+        else:
+            icon = (
+                icon_source
+                if isinstance(icon_source, QIcon)
+                else QIcon(str(icon_source))
+            )
+            self.icon_label.setPixmap(icon.pixmap(self.ICON_SIZE))
+
     def check_hover_state_and_correct(self):
         """
         检查鼠标当前是否在此按钮上方，并强制更新视觉状态以匹配。
@@ -80,6 +99,11 @@ class AnimatedBookmarkButton(QWidget):
                 if self.width() != self.compact_width:
                     self._collapse()
 
+    def collapse(self) -> None:
+        """如果按钮处于展开状态，则播放收缩动画（例如窗口失活时）。"""
+        if self.isVisible() and self.width() != self.compact_width:
+            self._collapse()
+
     def _expand(self):
         self.animation.stop()
         self.opacity_animation.stop()
@@ -2,7 +2,7 @@
 
 from typing import Optional
 from PyQt6.QtCore import QEvent
-from PyQt6.QtWidgets import QListWidget, QTextEdit
+from PyQt6.QtWidgets import QListView, QTextEdit
 from ui.theme_manager import get_current_theme
 
 # --- 为滚动条定义的QSS样式字符串 ---
@@ -73,8 +73,8 @@ SCROLLBAR_STYLE_LIGHT = """
 """
 
 
-class StyledListWidget(QListWidget):
-    """一个自动应用自定义滚动条样式的QListWidget。"""
+class StyledListView(QListView):
+    """一个自动应用自定义滚动条样式的QListView。"""
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -0,0 +1,105 @@
+# ui/components/entry_list_model.py
+
+from typing import Dict, Any, List, Optional, Tuple
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QObject, QSize, Qt
+
+from core.icon_fetcher import IconFetcher
+
+
+class EntryListModel(QAbstractListModel):
+    """
+    条目列表的数据模型。
+
+    每一行对应一个按名称分组的条目，行数据以普通的 Python 列表保存，
+    视图直接从中读取名称和图标，而不是为每一行创建 QListWidgetItem
+    和自定义小部件。
+    """
+
+    ROW_SIZE_HINT = QSize(0, 48)
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        # (名称, 代表性条目)
+        self._rows: List[Tuple[str, Dict[str, Any]]] = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.UserRole:
+            return self._rows[row][0]
+        if role == Qt.ItemDataRole.DecorationRole:
+            # IconFetcher 按图标数据缓存解码结果，这里无需再单独缓存
+            details = self._rows[row][1].get("details", {})
+            return IconFetcher.pixmap_from_base64(details.get("icon_data"))
+        if role == Qt.ItemDataRole.SizeHintRole:
+            return self.ROW_SIZE_HINT
+        return None
+
+    def set_rows(self, rows: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        用新的 (名称, 代表性条目) 列表更新模型内容。
+
+        新旧两个列表都按名称升序排列且名称唯一，因此可以像归并一样同时
+        遍历它们，只移除消失的行、插入新出现的行，保留下来的行不会被重建。
+        搜索时每次按键通常只会删掉少量行，视图也只需处理这些变化。
+        """
+        current = self._rows
+        i = j = 0
+        while j < len(rows):
+            name, entry = rows[j]
+
+            if i < len(current) and current[i][0] < name:
+                # 旧列表中名称更小的连续若干行已不在新结果中
+                end = i
+                while end < len(current) and current[end][0] < name:
+                    end += 1
+                self.beginRemoveRows(QModelIndex(), i, end - 1)
+                del current[i:end]
+                self.endRemoveRows()
+                continue
+
+            if i < len(current) and current[i][0] == name:
+                if current[i][1] is not entry:
+                    current[i] = rows[j]
+                    changed = self.index(i)
+                    self.dataChanged.emit(changed, changed)
+                i += 1
+                j += 1
+                continue
+
+            # 新结果中排在 current[i] 之前的连续若干行需要插入
+            limit = current[i][0] if i < len(current) else None
+            end = j
+            while end < len(rows) and (limit is None or rows[end][0] < limit):
+                end += 1
+            self.beginInsertRows(QModelIndex(), i, i + (end - j) - 1)
+            current[i:i] = rows[j:end]
+            self.endInsertRows()
+            i += end - j
+            j = end
+
+        if i < len(current):
+            self.beginRemoveRows(QModelIndex(), i, len(current) - 1)
+            del current[i:]
+            self.endRemoveRows()
+
+    def name_at(self, row: int) -> Optional[str]:
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+
+    def row_of(self, name: Optional[str]) -> int:
+        if name is None:
+            return -1
+        for row, (row_name, _) in enumerate(self._rows):
+            if row_name == name:
+                return row
+        return -1
@@ -14,11 +14,11 @@ from PyQt6.QtWidgets import (
     QProgressBar,
 )
 from PyQt6.QtCore import QTimer, Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QHideEvent, QShowEvent
 
 from language import t
-from utils.paths import resource_path
 from utils.clipboard import clipboard_manager
+from utils.icon_cache import icon_cache
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +30,24 @@ class TwoFAWidget(QWidget):
 
     def __init__(self, secret: str, parent: Optional[QWidget] = None):
         super().__init__(parent)
+        self.is_valid = False
+        self.totp: Optional[pyotp.TOTP] = None
+
+        self.init_ui()
+        self.retranslate_ui()
+
+        # 定时器只创建一次；切换密钥时仅启动或停止它，以便同一个小部件
+        # 可以在详情面板中被不同条目重复使用。
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.update_code)
+
+        self.set_secret(secret)
+
+    def set_secret(self, secret: str) -> None:
+        """切换此小部件显示的TOTP密钥，并相应地启动或停止刷新定时器。"""
+        self.timer.stop()
+        # 不保留上一个密钥，即使新的密钥为空或无效
+        self.totp = None
 
         # --- MODIFICATION START: Improved secret validation ---
         # 1. 首先，明确检查传入的 'secret' 是否为非空字符串。
@@ -48,22 +66,34 @@ class TwoFAWidget(QWidget):
             self.is_valid = False
         # --- MODIFICATION END ---
 
-        self.init_ui()
-
         if self.is_valid:
             # 只有在密钥绝对有效时，才启动定时器。
-            self.timer = QTimer(self)
-            self.timer.timeout.connect(self.update_code)
-            self.timer.start(1000)
+            # 不可见时（例如所在选项卡未被选中）只刷新一次，
+            # 定时器由 showEvent 在控件真正显示时启动。
+            self.progress_bar.setVisible(True)
+            self.copy_button.setEnabled(True)
+            if self.isVisible():
+                self.timer.start(1000)
             self.update_code()
         else:
             # --- MODIFICATION START: Improved UI for invalid state ---
             # 如果密钥无效或未设置，显示清晰的状态并禁用不必要的功能。
-            self.code_display.setText(t.get("2fa_status_not_setup"))
+            self.code_display.setText(self._str_not_setup)
             self.progress_bar.setVisible(False)
             self.copy_button.setEnabled(False)
             # --- MODIFICATION END ---
 
+    def showEvent(self, a0: Optional[QShowEvent]) -> None:
+        super().showEvent(a0)
+        if self.is_valid and not self.timer.isActive():
+            self.update_code()
+            self.timer.start(1000)
+
+    def hideEvent(self, a0: Optional[QHideEvent]) -> None:
+        # 看不到的验证码无需每秒刷新
+        super().hideEvent(a0)
+        self.timer.stop()
+
     def init_ui(self) -> None:
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -82,10 +112,9 @@ class TwoFAWidget(QWidget):
 
         self.copy_button = QPushButton()
         self.copy_button.setObjectName("inlineButton")
-        self.copy_button.setIcon(QIcon(str(resource_path("ui/assets/icons/copy.svg"))))
+        self.copy_button.setIcon(icon_cache.get("copy"))
         self.copy_button.setText("")
         self.copy_button.setFixedSize(32, 32)
-        self.copy_button.setToolTip(t.get("button_copy"))
         self.copy_button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
         self.copy_button.clicked.connect(self.copy_to_clipboard)
 
@@ -100,6 +129,13 @@ class TwoFAWidget(QWidget):
         main_layout.addLayout(value_layout)
         main_layout.addWidget(self.progress_bar)
 
+    def retranslate_ui(self) -> None:
+        # 切换条目时频繁用到的状态文本只在语言变化时解析一次
+        self._str_not_setup = t.get("2fa_status_not_setup")
+        self.copy_button.setToolTip(t.get("button_copy"))
+        if not self.is_valid:
+            self.code_display.setText(self._str_not_setup)
+
     def update_code(self) -> None:
         """生成新的TOTP代码并更新倒计时进度条。"""
         if not self.is_valid:
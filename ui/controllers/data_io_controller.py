@@ -73,7 +73,7 @@ class DataIOController(QObject):
                 )
                 return
 
-        def on_import_error(err: Exception, tb: str):
+        def on_import_error(err: Exception):
             # --- MODIFICATION START: Correctly format the error message ---
             error_message = t.get("msg_import_fail_message", error=str(err))
             CustomMessageBox.information(
@@ -162,7 +162,7 @@ class DataIOController(QObject):
 
         is_csv = "csv" in selected_filter.lower()
 
-        def on_error(err: Exception, tb: str):
+        def on_error(err: Exception):
             # --- MODIFICATION START: Correctly format the error message ---
             error_message = t.get(
                 "msg_export_fail", error=str(err)
@@ -185,7 +185,7 @@ class DataIOController(QObject):
                     t.get("msg_export_success", count=len(all_entries), path=file_path),
                 )
             except Exception as e:
-                on_error(e, "")
+                on_error(e)
 
         if not is_csv:
             task_manager.run_in_background(
@@ -218,10 +218,19 @@ class DataIOController(QObject):
 
         include_totp = reply == QDialog.DialogCode.Accepted
 
+        def on_csv_written(_result: None):
+            CustomMessageBox.information(
+                self.main_window,
+                t.get("msg_export_success_title"),
+                t.get("msg_export_success", count=len(all_entries), path=file_path),
+            )
+
+        # CSV 在后台线程中逐行写入文件，不在内存中生成完整的字符串
         task_manager.run_in_background(
-            DataHandler.export_to_csv,
-            on_success=on_success,
+            DataHandler.export_to_csv_file,
+            on_success=on_csv_written,
             on_error=on_error,
             entries=all_entries,
+            file_path=file_path,
             include_totp=include_totp,
         )
@@ -2,18 +2,15 @@
 
 import logging
 from collections import defaultdict
+from operator import itemgetter
 from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
-from PyQt6.QtWidgets import QDialog, QApplication, QMainWindow, QWidget, QListWidgetItem
-from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtWidgets import QDialog, QApplication, QMainWindow, QWidget
+from PyQt6.QtCore import QObject, QModelIndex, QTimer, pyqtSignal
 
 from language import t
 from config import load_settings, save_settings
-from ..dialogs.add_edit_dialog import AddEditDialog
-from ..dialogs.change_password_dialog import ChangePasswordDialog
-from ..dialogs.generator_dialog import GeneratorWindow
 from ..dialogs.message_box_dialog import CustomMessageBox
-from ..dialogs.settings_dialog import SettingsDialog
 from ..task_manager import task_manager
 from ..theme_manager import apply_theme, get_current_theme
 from .data_io_controller import DataIOController
@@ -29,6 +26,8 @@ logger = logging.getLogger(__name__)
 class MainWindowController(QObject):
     settings_changed = pyqtSignal()
 
+    SEARCH_DEBOUNCE_MS = 120
+
     def __init__(
         self,
         main_app_window: QMainWindow,
@@ -48,11 +47,35 @@ class MainWindowController(QObject):
 
         self.all_entries: List[Dict[str, Any]] = []
         self.entries_by_name: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.entries_by_id: Dict[int, Dict[str, Any]] = {}
+        self.entries_by_category: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
         self.category_icons: Dict[str, str] = {}
-
-        self.current_category: str = t.get("all_categories")
+        self._load_generation: int = 0
+        # 详情面板当前显示的条目分组
+        self._displayed_group: Optional[List[Dict[str, Any]]] = None
+        # 以下索引只在数据加载后构建一次，供每次过滤和刷新侧边栏时复用
+        self._search_text_by_id: Dict[int, str] = {}
+        self._sorted_categories: List[str] = []
+        # 按名称排序的全部条目。分类索引也按此顺序构建，因此任何过滤结果
+        # 天然有序，刷新列表时无需再排序。all_entries 保持数据库顺序供导出使用。
+        self._entries_in_name_order: List[Dict[str, Any]] = []
+
+        # "所有项目" 的翻译文本在过滤时频繁比较，缓存一份并在语言切换时刷新
+        self._all_categories_text: str = t.get("all_categories")
+        self.current_category: str = self._all_categories_text
         self.current_search_term: str = ""
 
+        # 增量过滤缓存：新的搜索词是上一次的延伸时，只需在上一次的结果中继续过滤
+        self._last_search_term: str = ""
+        self._last_category: Optional[str] = None
+        self._last_matches: List[Dict[str, Any]] = []
+
+        # 合并连续的按键输入，只在输入停顿后刷新一次列表
+        self._search_debounce_timer = QTimer(self)
+        self._search_debounce_timer.setSingleShot(True)
+        self._search_debounce_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_debounce_timer.timeout.connect(self._filter_and_display_entries)
+
         self._connect_signals()
 
     def _connect_signals(self) -> None:
@@ -69,19 +92,30 @@ class MainWindowController(QObject):
 
         self.content_view.add_button.clicked.connect(self._open_add_dialog)
         self.content_view.search_input.textChanged.connect(self.on_search_term_changed)
-        self.content_view.entry_list.currentItemChanged.connect(self.on_entry_selected)
+        self.content_view.entry_list.selectionModel().currentChanged.connect(
+            self.on_entry_selected
+        )
         self.content_view.details_view.edit_requested.connect(self._open_edit_dialog)
         self.content_view.details_view.delete_requested.connect(self.on_delete_entry)
 
     def load_initial_data(self) -> None:
+        # 每次加载都有一个递增的编号。保存、删除、导入后可能连续触发多次加载，
+        # 后台任务的完成顺序不一定与发起顺序一致，过期的结果直接丢弃。
+        self._load_generation += 1
+        generation = self._load_generation
+
         def on_success(data):
+            if generation != self._load_generation:
+                logger.debug("Discarding stale entry load result.")
+                return
             self.all_entries, self.category_icons = data
+            self._invalidate_filter_cache()
             self._organize_entries()
             self._update_sidebar()
             self._filter_and_display_entries()
 
-        def on_error(err: Exception, tb: str):
-            logger.error(f"Failed to load initial data: {err}\nTraceback:\n{tb}")
+        def on_error(err: Exception):
+            logger.error(f"Failed to load initial data: {err}", exc_info=err)
             CustomMessageBox.information(
                 self.main_app_window, t.get("error_title_generic"), str(err)
             )
@@ -97,54 +131,91 @@ class MainWindowController(QObject):
 
     def _organize_entries(self) -> None:
         self.entries_by_name = defaultdict(list)
-        for entry in self.all_entries:
+        self.entries_by_id = {}
+        self.entries_by_category = defaultdict(list)
+        self._search_text_by_id = {}
+        # 稳定排序：同名条目保持原有顺序，分组中的代表性条目不变
+        self._entries_in_name_order = sorted(self.all_entries, key=itemgetter("name"))
+        for entry in self._entries_in_name_order:
             self.entries_by_name[entry["name"]].append(entry)
+            self.entries_by_id[entry["id"]] = entry
+            self.entries_by_category[entry["category"]].append(entry)
+
+            # 预先把所有可搜索字段转为小写并拼接，按键过滤时只需一次子串查找。
+            # 搜索框是单行输入，搜索词不会包含换行符，因此不会跨字段误匹配。
+            details = entry.get("details", {})
+            self._search_text_by_id[entry["id"]] = "\n".join(
+                (
+                    entry.get("name", ""),
+                    entry.get("category", ""),
+                    details.get("username", ""),
+                    details.get("url", ""),
+                    details.get("notes", ""),
+                    details.get("backup_codes", ""),
+                )
+            ).lower()
+        self._sorted_categories = sorted(c for c in self.entries_by_category if c)
 
     def _update_sidebar(self) -> None:
-        all_categories = sorted(
-            list(set(e["category"] for e in self.all_entries if e["category"]))
+        self.sidebar_view.populate_categories(
+            self._sorted_categories, self.category_icons
         )
-        self.sidebar_view.populate_categories(all_categories, self.category_icons)
         self.sidebar_view.set_active_category(self.current_category)
         # --- MODIFICATION START: Centralize re-translation here ---
         # 确保在每次侧边栏更新时（包括语言更改后），都重新翻译所有静态按钮的文本。
         self.sidebar_view.retranslate_ui()
         # --- MODIFICATION END ---
 
+    def _invalidate_filter_cache(self) -> None:
+        self._last_search_term = ""
+        self._last_category = None
+        self._last_matches = []
+
     def _filter_and_display_entries(self) -> None:
-        if self.current_category == t.get("all_categories"):
-            filtered_by_cat = self.all_entries
-        else:
-            filtered_by_cat = [
-                e for e in self.all_entries if e["category"] == self.current_category
-            ]
-
-        if self.current_search_term:
-            term = self.current_search_term.lower()
-            filtered_by_search = [
-                entry
-                for entry in filtered_by_cat
-                if (
-                    term in entry.get("name", "").lower()
-                    or term in entry.get("category", "").lower()
-                    or term in entry.get("details", {}).get("username", "").lower()
-                    or term in entry.get("details", {}).get("url", "").lower()
-                    or term in entry.get("details", {}).get("notes", "").lower()
-                    or term in entry.get("details", {}).get("backup_codes", "").lower()
-                )
-            ]
+        # 立即刷新时（例如切换分类），挂起的搜索刷新已无必要
+        self._search_debounce_timer.stop()
+        term = self.current_search_term.lower()
+        can_refine = self._last_category == self.current_category and term.startswith(
+            self._last_search_term
+        )
+
+        if can_refine and term == self._last_search_term:
+            filtered_by_search = self._last_matches
         else:
-            filtered_by_search = filtered_by_cat
+            if can_refine:
+                # 搜索词只是在上一次的基础上延伸，结果必然是上一次结果的子集
+                candidates = self._last_matches
+            elif self.current_category == self._all_categories_text:
+                candidates = self._entries_in_name_order
+            else:
+                candidates = self.entries_by_category.get(self.current_category, [])
+
+            if term:
+                search_text_by_id = self._search_text_by_id
+                filtered_by_search = [
+                    entry
+                    for entry in candidates
+                    if term in search_text_by_id[entry["id"]]
+                ]
+            else:
+                filtered_by_search = candidates
+
+        self._last_search_term = term
+        self._last_category = self.current_category
+        self._last_matches = filtered_by_search
 
+        # 候选列表按名称有序，分组字典的插入顺序即为排序后的名称顺序
         entries_to_display = defaultdict(list)
         for entry in filtered_by_search:
             entries_to_display[entry["name"]].append(entry)
 
         current_selection = self.content_view.get_selected_entry_name()
-        self.content_view.populate_entry_list(entries_to_display, current_selection)
+        self.content_view.populate_entry_list(
+            list(entries_to_display), entries_to_display, current_selection
+        )
 
-        current_item = self.content_view.entry_list.currentItem()
-        self.on_entry_selected(current_item, None)
+        current_index = self.content_view.entry_list.currentIndex()
+        self.on_entry_selected(current_index, QModelIndex())
 
     def on_category_selected(self, category_name: str) -> None:
         self.current_category = category_name
@@ -153,30 +224,36 @@ class MainWindowController(QObject):
 
     def on_search_term_changed(self, term: str) -> None:
         self.current_search_term = term
-        self._filter_and_display_entries()
+        self._search_debounce_timer.start()
 
     def on_entry_selected(
         self,
-        current_item: Optional[QListWidgetItem],
-        previous_item: Optional[QListWidgetItem],
+        current_index: QModelIndex,
+        previous_index: QModelIndex,
     ) -> None:
-        if not current_item:
-            self.content_view.details_view.clear_details()
+        if not current_index.isValid():
+            self._clear_displayed_entry()
             return
 
-        selected_name = current_item.data(Qt.ItemDataRole.UserRole)
+        selected_name = self.content_view.entry_model.name_at(current_index.row())
 
         if selected_name and selected_name in self.entries_by_name:
-            self.content_view.details_view.display_entry_group(
-                self.entries_by_name[selected_name]
-            )
+            group = self.entries_by_name[selected_name]
+            # 刷新列表时选中项变化信号和显式调用可能先后到达同一个分组，
+            # 详情面板已在显示它时无需再次更新。重新加载数据会生成新的分组列表。
+            if group is self._displayed_group:
+                return
+            self._displayed_group = group
+            self.content_view.details_view.display_entry_group(group)
         else:
-            self.content_view.details_view.clear_details()
+            self._clear_displayed_entry()
+
+    def _clear_displayed_entry(self) -> None:
+        self._displayed_group = None
+        self.content_view.details_view.clear_details()
 
     def on_delete_entry(self, entry_id: int) -> None:
-        entry_to_delete = next(
-            (e for e in self.all_entries if e["id"] == entry_id), None
-        )
+        entry_to_delete = self.entries_by_id.get(entry_id)
         if not entry_to_delete:
             return
 
@@ -198,6 +275,9 @@ class MainWindowController(QObject):
             self.load_initial_data()
 
     def _open_add_dialog(self) -> None:
+        # 对话框模块只在用户首次打开时才导入，以缩短主窗口的启动时间
+        from ..dialogs.add_edit_dialog import AddEditDialog
+
         dialog = AddEditDialog(self.main_app_window)
         if dialog.exec():
             data = dialog.get_data()
@@ -219,10 +299,12 @@ class MainWindowController(QObject):
             self.load_initial_data()
 
     def _open_edit_dialog(self, entry_id: int) -> None:
-        entry_to_edit = next((e for e in self.all_entries if e["id"] == entry_id), None)
+        entry_to_edit = self.entries_by_id.get(entry_id)
         if not entry_to_edit:
             return
 
+        from ..dialogs.add_edit_dialog import AddEditDialog
+
         dialog = AddEditDialog(self.main_app_window, entry_to_edit)
         if dialog.exec():
             data = dialog.get_data()
@@ -244,9 +326,13 @@ class MainWindowController(QObject):
             self.load_initial_data()
 
     def _open_generator_dialog(self) -> None:
+        from ..dialogs.generator_dialog import GeneratorWindow
+
         GeneratorWindow(self.main_app_window).exec()
 
     def _open_settings_dialog(self) -> None:
+        from ..dialogs.settings_dialog import SettingsDialog
+
         dialog = SettingsDialog(self.main_app_window)
 
         dialog.change_password_requested.connect(self._handle_change_password)
@@ -313,6 +399,8 @@ class MainWindowController(QObject):
         logger.info(f"Theme '{theme_name}' applied and UI refreshed.")
 
     def _handle_change_password(self):
+        from ..dialogs.change_password_dialog import ChangePasswordDialog
+
         dialog = ChangePasswordDialog(self.main_app_window)
         if not dialog.exec():
             return
@@ -350,8 +438,8 @@ class MainWindowController(QObject):
                     t.get("msg_pass_change_fail_old_wrong"),
                 )
 
-        def on_error(err: Exception, tb: str):
-            logger.error(f"Failed to change password: {err}\nTraceback:\n{tb}")
+        def on_error(err: Exception):
+            logger.error(f"Failed to change password: {err}", exc_info=err)
             CustomMessageBox.information(
                 self.main_app_window, t.get("error_title_generic"), str(err)
             )
@@ -365,7 +453,8 @@ class MainWindowController(QObject):
         )
 
     def handle_language_change(self):
-        self.current_category = t.get("all_categories")
+        self._all_categories_text = t.get("all_categories")
+        self.current_category = self._all_categories_text
         # 调用 load_initial_data() 会触发一个完整的刷新流程,
         # 其中包括调用 _update_sidebar(), 从而确保所有文本都被更新。
         self.load_initial_data()
@@ -15,10 +15,9 @@ from PyQt6.QtWidgets import (
     QTabWidget,
 )
 from PyQt6.QtCore import QSize
-from PyQt6.QtGui import QIcon
 
 from language import t
-from utils.paths import resource_path
+from utils.icon_cache import icon_cache
 
 # 2. 使用 TYPE_CHECKING 来避免循环导入
 # 这段代码只在类型检查时运行，所以不会在程序实际执行时导致错误。
@@ -151,7 +150,7 @@ class AddEditDialogUI:
         d.set_cat_icon_btn = QPushButton()
         d.set_cat_icon_btn.setObjectName("inlineButton")
         d.set_cat_icon_btn.setIcon(
-            QIcon(str(resource_path("ui/assets/icons/edit.svg")))
+            icon_cache.get("edit")
         )
         d.set_cat_icon_btn.setToolTip(t.get("tooltip_set_cat_icon"))
         layout.addWidget(d.category_input)
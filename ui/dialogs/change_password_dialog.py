@@ -18,6 +18,7 @@ from PyQt6.QtCore import Qt, QPoint
 from PyQt6.QtGui import QMouseEvent
 
 from language import t
+from utils.password_policy import is_password_strong
 
 logger = logging.getLogger(__name__)
 
@@ -92,15 +93,6 @@ class ChangePasswordDialog(QDialog):
         dialog_layout = QVBoxLayout(self)
         dialog_layout.addWidget(container)
 
-    def _is_password_strong(self, password: str) -> bool:
-        """Checks if the password meets the required strength criteria."""
-        return (
-            len(password) >= 8
-            and any(c.isupper() for c in password)
-            and any(c.islower() for c in password)
-            and any(c.isdigit() for c in password)
-        )
-
     def get_passwords(self) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
         """
         获取并验证用户输入的密码。
@@ -113,7 +105,7 @@ class ChangePasswordDialog(QDialog):
             return None, "empty"
         if new_pass != confirm_pass:
             return None, "mismatch"
-        if not self._is_password_strong(new_pass):
+        if not is_password_strong(new_pass):
             return None, "weak"
 
         return (old_pass, new_pass), None
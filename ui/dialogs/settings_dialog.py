@@ -18,11 +18,12 @@ from PyQt6.QtWidgets import (
     QSpinBox,
 )
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal, QEvent, QObject
-from PyQt6.QtGui import QMouseEvent, QIcon, QShowEvent
+from PyQt6.QtGui import QMouseEvent, QShowEvent
 
 from language import t
 from config import load_settings
 from utils.paths import resource_path  # 确保导入了 resource_path
+from utils.icon_cache import icon_cache
 from ..theme_manager import get_current_theme
 
 logger = logging.getLogger(__name__)
@@ -282,11 +283,11 @@ class SettingsDialog(QDialog):
             t.get("settings_section_data")
         )
         import_button = QPushButton(f" {t.get('button_import')}")
-        import_button.setIcon(QIcon(str(resource_path("ui/assets/icons/import.svg"))))
+        import_button.setIcon(icon_cache.get("import"))
         import_button.setFixedWidth(150)
         import_button.clicked.connect(self.import_requested.emit)
         export_button = QPushButton(f" {t.get('button_export')}")
-        export_button.setIcon(QIcon(str(resource_path("ui/assets/icons/export.svg"))))
+        export_button.setIcon(icon_cache.get("export"))
         export_button.setFixedWidth(150)
         export_button.clicked.connect(self.export_requested.emit)
         buttons_widget = QWidget()
@@ -70,11 +70,11 @@ class IconManager:
             self.update_icon_preview()
             self.icon_preview_button.setEnabled(True)
 
-        def on_error(err: Exception, tb: str):
+        def on_error(err: Exception):
             CustomMessageBox.information(
                 self.parent, t.get("error_title_generic"), t.get("error_fetch_failed")
             )
-            logger.error(f"Error fetching icon: {err}\n{tb}")
+            logger.error(f"Error fetching icon: {err}", exc_info=err)
             self.icon_preview_button.setEnabled(True)
 
         task_manager.run_in_background(
@@ -1,103 +1,114 @@
 # ui/task_manager.py
 
 import logging
-import traceback
-from typing import Callable, Any, List, Tuple, Optional
+from typing import Callable, Any, Optional, Set
 
-from PyQt6.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 logger = logging.getLogger(__name__)
 
 
-class Worker(QObject):
+class WorkerSignals(QObject):
     """
-    一个通用的工作器 QObject，可以被移动到后台线程执行任务。
-    它通过信号与主线程进行通信，确保线程安全。
+    Worker 的信号载体。QRunnable 本身不是 QObject，无法定义信号，
+    因此由这个对象负责把结果从线程池线程安全地传回主线程。
     """
 
     finished = pyqtSignal(object)
-    error = pyqtSignal(Exception, str)
+    error = pyqtSignal(Exception)
+
+
+class Worker(QRunnable):
+    """
+    一个通用的可运行任务，由线程池中的线程执行。
+    它通过信号与主线程进行通信，确保线程安全。
+    """
 
     def __init__(self, task: Callable[..., Any], *args, **kwargs):
         super().__init__()
         self.task = task
         self.args = args
         self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        # 生命周期由 TaskManager 持有的引用管理，而不是由线程池自动删除
+        self.setAutoDelete(False)
 
-    @pyqtSlot()
     def run(self):
         """
-        当后台线程启动时，此槽函数会被自动调用以执行任务。
+        当线程池调度到此任务时，此方法会在工作线程中被调用。
         """
         try:
             logger.debug(f"Worker starting task: {self.task.__name__}")
             result = self.task(*self.args, **self.kwargs)
             logger.debug(f"Worker finished task: {self.task.__name__}")
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            tb_str = traceback.format_exc()
+            # 不再主动格式化调用栈：日志系统只在真正输出时才格式化，
+            # 需要调用栈的回调可以通过 e.__traceback__ 自行获取
             logger.error(
-                f"An error occurred in worker task '{self.task.__name__}':\n{tb_str}"
+                f"An error occurred in worker task '{self.task.__name__}': {e}",
+                exc_info=e,
             )
-            self.error.emit(e, tb_str)
+            self.signals.error.emit(e)
 
 
 class TaskManager:
     """
     一个全局单例的任务管理器，用于轻松地在后台线程中运行耗时函数。
-    它封装了 QThread 和 Worker 的创建、管理和生命周期，解决了对象被过早
-    垃圾回收的关键问题。
+    任务在一个复用线程的 QThreadPool 中执行，无需为每个任务创建和销毁
+    QThread。正在运行的任务会被保留引用，直到结果送达主线程，
+    以避免对象被过早垃圾回收。
     """
 
+    MAX_THREAD_COUNT = 4
+
     def __init__(self):
-        self.running_tasks: List[Tuple[QThread, Worker]] = []
+        self.running_tasks: Set[Worker] = set()
+        self._thread_pool: Optional[QThreadPool] = None
+
+    def _get_thread_pool(self) -> QThreadPool:
+        if self._thread_pool is None:
+            self._thread_pool = QThreadPool()
+            self._thread_pool.setMaxThreadCount(self.MAX_THREAD_COUNT)
+        return self._thread_pool
 
     def run_in_background(
         self,
         task: Callable[..., Any],
         on_success: Optional[Callable[[Any], None]] = None,
-        on_error: Optional[Callable[[Exception, str], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
         *args,
         **kwargs,
     ):
         """
         在后台线程中异步执行一个任务。
         """
-        thread = QThread()
         worker = Worker(task, *args, **kwargs)
-        worker.moveToThread(thread)
 
-        task_reference = (thread, worker)
-        self.running_tasks.append(task_reference)
+        self.running_tasks.add(worker)
         logger.debug(
-            f"Task '{task.__name__}' appended. Currently running tasks: {len(self.running_tasks)}"
+            f"Task '{task.__name__}' queued. Currently running tasks: {len(self.running_tasks)}"
         )
 
-        thread.started.connect(worker.run)
-
-        worker.finished.connect(thread.quit)
-        worker.error.connect(thread.quit)
-        thread.finished.connect(thread.deleteLater)
-        worker.finished.connect(worker.deleteLater)
-        worker.error.connect(worker.deleteLater)
-
-        thread.finished.connect(lambda: self._cleanup_task(task_reference))
-
         if on_success:
-            worker.finished.connect(on_success)
+            worker.signals.finished.connect(on_success)
         if on_error:
-            worker.error.connect(on_error)
+            worker.signals.error.connect(on_error)
+
+        # 清理必须在用户回调之后连接，保证回调执行时任务仍被引用
+        worker.signals.finished.connect(lambda _result: self._cleanup_task(worker))
+        worker.signals.error.connect(lambda _err: self._cleanup_task(worker))
 
-        thread.start()
+        self._get_thread_pool().start(worker)
 
-    def _cleanup_task(self, task_ref: Tuple[QThread, Worker]):
-        """当任务完成时，从正在运行的列表中安全地移除它。"""
+    def _cleanup_task(self, worker: Worker):
+        """当任务完成时，从正在运行的集合中安全地移除它。"""
         try:
-            self.running_tasks.remove(task_ref)
+            self.running_tasks.remove(worker)
             logger.debug(
                 f"Task cleaned up. Currently running tasks: {len(self.running_tasks)}"
             )
-        except ValueError:
+        except KeyError:
             logger.warning(
                 "Attempted to clean up a task that was not in the running list."
             )
@@ -1,14 +1,16 @@
 # ui/theme_manager.py
 
+import glob
+import hashlib
 import logging
 import re
 import os
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import QApplication
 
 from utils.paths import resource_path
-from config import load_settings, save_settings
+from config import APP_DATA_DIR, load_settings, save_settings
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,31 @@ THEMES: Dict[str, Dict[str, str]] = {
     },
 }
 
+# QSS 解析用到的正则表达式只在模块加载时编译一次
+# 一次扫描同时匹配 @import（第1组）和 url(...)（第2组），
+# url() 会忽略数据URI (如 url('data:image/...'))
+_QSS_REWRITE_RE = re.compile(
+    r'@import\s+url\("([^"]+)"\);|url\((?![\'"]?data:)([^)]+)\)'
+)
+
+# 已解析的QSS内容，键为归一化后的项目相对路径。
+# 样式表在运行期间不会变化，因此每个文件在进程中最多只读取和解析一次。
+_QSS_CACHE: Dict[str, str] = {}
+# url() 括号内的原始文本 -> 重写后的 url("绝对路径")
+_URL_SUBSTITUTIONS: Dict[str, str] = {}
+# 每个主题最终拼接好的完整样式表，来回切换主题时直接复用
+_FULL_SHEET_CACHE: Dict[str, str] = {}
+# 已提交到后台预解析的主题，避免重复排队
+_PRELOAD_SCHEDULED: Set[str] = set()
+
+# 当前已应用到 QApplication 的主题。重复应用同一主题会触发整个控件树的
+# 样式重算（每个控件都要 unpolish/polish），因此直接跳过
+_ACTIVE_THEME: Optional[str] = None
+
+# 拼接好的样式表也会持久化到磁盘，冷启动时若源文件未变化则无需重新解析
+QSS_SOURCE_DIR = "ui/assets"
+THEME_CACHE_DIR = os.path.join(APP_DATA_DIR, "cache")
+
 
 def get_current_theme() -> str:
     """获取当前保存的主题设置。"""
@@ -38,77 +65,263 @@ def set_current_theme(theme_name: str) -> None:
 
 
 # --- MODIFICATION START ---
+def _normalize_qss_path(file_path: str) -> str:
+    # 归一化路径以处理 '..' 等情况
+    return os.path.normpath(file_path).replace("\\", "/")
+
+
+def _resolve_import(importer_path: str, imported_path: str) -> str:
+    # @import 中的路径是相对于当前QSS文件的
+    return _normalize_qss_path(
+        os.path.join(os.path.dirname(importer_path), imported_path)
+    )
+
+
 def _load_and_parse_qss(file_path: str) -> str:
     """
-    加载一个QSS文件，并递归解析其 @import 语句，同时将所有 url()
-    中的相对路径转换为绝对路径。
+    加载一个QSS文件，解析其 @import 语句，同时将所有 url()
+    中的相对路径转换为绝对路径。结果按文件路径缓存。
+
+    导入关系使用显式的工作栈按后序处理（先处理被导入的文件），
+    不再在 re.sub 的回调中递归调用自身。
     """
+    root_path = _normalize_qss_path(file_path)
+    cached = _QSS_CACHE.get(root_path)
+    if cached is not None:
+        return cached
+
+    # 已读取但尚未完成解析的文件内容
+    pending_content: Dict[str, str] = {}
+    # (路径, 其导入的文件是否都已解析)
+    stack: List[Tuple[str, bool]] = [(root_path, False)]
+
+    while stack:
+        path, imports_ready = stack.pop()
+        if path in _QSS_CACHE:
+            continue
+
+        if imports_ready:
+            _QSS_CACHE[path] = _parse_qss_content(path, pending_content.pop(path))
+            continue
+
+        if path in pending_content:
+            continue
+
+        content = _read_qss_file(path)
+        pending_content[path] = content
+        stack.append((path, True))
+        for imported in _iter_import_targets(content):
+            imported_path = _resolve_import(path, imported)
+            if imported_path in pending_content:
+                logger.warning(
+                    f"Circular QSS import detected: {path} -> {imported_path}"
+                )
+            elif imported_path not in _QSS_CACHE:
+                logger.debug(f"Parsing imported QSS file: {imported_path}")
+                stack.append((imported_path, False))
+
+    return _QSS_CACHE[root_path]
+
+
+def _iter_import_targets(content: str) -> Iterator[str]:
+    """
+    按出现顺序产出 @import url("..."); 中的文件路径。
+
+    语法是固定前缀的字面量，用 str.find 线性扫描即可，
+    不必为每个文件启动一次正则匹配。匹配规则与 _QSS_REWRITE_RE 的
+    @import 分支相同。
+    """
+    find = content.find
+    length = len(content)
+    pos = find("@import")
+    while pos != -1:
+        i = pos + 7
+        # 与 \s+ 一致：@import 与 url 之间至少有一个空白字符
+        start = i
+        while i < length and content[i].isspace():
+            i += 1
+        if i > start and content.startswith('url("', i):
+            path_start = i + 5
+            path_end = find('"', path_start)
+            if path_end > path_start and content.startswith(");", path_end + 1):
+                yield content[path_start:path_end]
+                pos = find("@import", path_end + 3)
+                continue
+        pos = find("@import", pos + 7)
+
+
+def _read_qss_file(file_path: str) -> str:
     full_path = resource_path(file_path)
 
     try:
-        with open(full_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        # 样式表很小，整体以字节读取后一次性解码，比文本模式逐块解码更省事。
+        # QSS 解析器本身可以处理 \r\n，无需换行符转换。
+        with open(full_path, "rb") as f:
+            return f.read().decode("utf-8")
     except FileNotFoundError:
         logger.error(f"Stylesheet file not found: {full_path}")
         return ""
 
-    # 1. 递归解析 @import 语句
-    import_pattern = re.compile(r'@import\s+url\("([^"]+)"\);')
 
-    def import_replacer(match):
-        imported_file_relative_path = match.group(1)
-        # @import 中的路径是相对于当前QSS文件的
-        imported_file_project_path = os.path.join(
-            os.path.dirname(file_path), imported_file_relative_path
-        )
-        # 归一化路径以处理 '..' 等情况
-        normalized_path = os.path.normpath(imported_file_project_path).replace(
-            "\\", "/"
-        )
-        logger.debug(f"Parsing imported QSS file: {normalized_path}")
-        return _load_and_parse_qss(normalized_path)
-
-    content_with_imports = import_pattern.sub(import_replacer, content)
+def _parse_qss_content(file_path: str, content: str) -> str:
+    """
+    替换一个文件中的 @import（其导入的文件此时均已解析）和 url() 路径。
+    两种语句由同一个组合正则在一次扫描中完成替换。
+    """
 
-    # 2. 将所有 url() 路径转换为绝对路径
-    # 这个正则表达式会查找 url(...)，但会忽略数据URI (如 url('data:image/...'))
-    url_pattern = re.compile(r'url\((?![\'"]?data:)([^)]+)\)')
+    def replacer(match):
+        imported = match.group(1)
+        if imported is not None:
+            # 1. 用已解析的内容替换 @import 语句。被导入的内容中的 url()
+            #    已经重写过，不会被再次扫描。
+            imported_path = _resolve_import(file_path, imported)
+            # 循环导入的文件此时尚未解析完成，将其替换为空内容
+            return _QSS_CACHE.get(imported_path, "")
 
-    def url_replacer(match):
-        # 获取括号内的路径，并去除可能存在的引号和空格
-        relative_path = match.group(1).strip().strip("'\"")
-        # 假设所有 url() 中的路径都是相对于项目根目录的
-        absolute_path = resource_path(relative_path).replace("\\", "/")
-        return f'url("{absolute_path}")'
+        # 2. 将 url() 路径转换为绝对路径
+        raw_path = match.group(2)
+        substitution = _URL_SUBSTITUTIONS.get(raw_path)
+        if substitution is None:
+            # 获取括号内的路径，并去除可能存在的引号和空格
+            relative_path = raw_path.strip().strip("'\"")
+            # 假设所有 url() 中的路径都是相对于项目根目录的
+            absolute_path = resource_path(relative_path).replace("\\", "/")
+            substitution = f'url("{absolute_path}")'
+            _URL_SUBSTITUTIONS[raw_path] = substitution
+        return substitution
 
-    parsed_content = url_pattern.sub(url_replacer, content_with_imports)
-    return parsed_content
+    # 大多数被导入的文件只包含普通选择器，先用子串检查跳过不必要的正则替换
+    if "@import" not in content and "url(" not in content:
+        return content
+    return _QSS_REWRITE_RE.sub(replacer, content)
 
 
 # --- MODIFICATION END ---
 
 
+def _get_theme_stylesheet(theme_name: str) -> str:
+    """返回指定主题完整的样式表字符串，首次构建后会被缓存。"""
+    full_stylesheet = _FULL_SHEET_CACHE.get(theme_name)
+    if full_stylesheet is not None:
+        return full_stylesheet
+
+    cache_file = os.path.join(
+        THEME_CACHE_DIR, f"theme_{theme_name}_{_qss_sources_fingerprint()}.qss"
+    )
+    full_stylesheet = _read_theme_disk_cache(cache_file)
+    if full_stylesheet is None:
+        theme_files = THEMES[theme_name]
+        style_qss = _load_and_parse_qss(theme_files["style"])
+        app_ui_qss = _load_and_parse_qss(theme_files["app_ui"])
+        full_stylesheet = "\n".join((style_qss, app_ui_qss))
+        _write_theme_disk_cache(theme_name, cache_file, full_stylesheet)
+
+    _FULL_SHEET_CACHE[theme_name] = full_stylesheet
+    return full_stylesheet
+
+
+def _qss_sources_fingerprint() -> str:
+    """
+    根据所有QSS源文件的路径、修改时间和大小计算指纹。
+    资源根目录也计入指纹，因为重写后的 url() 中包含绝对路径
+    （例如 PyInstaller 每次运行时解压的临时目录都不同）。
+    """
+    source_root = resource_path(QSS_SOURCE_DIR)
+    hasher = hashlib.blake2b(digest_size=8)
+    hasher.update(source_root.encode("utf-8"))
+    for path in sorted(
+        glob.glob(os.path.join(source_root, "**", "*.qss"), recursive=True)
+    ):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        hasher.update(f"{path}|{stat.st_mtime_ns}|{stat.st_size}".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def _read_theme_disk_cache(cache_file: str) -> Optional[str]:
+    try:
+        with open(cache_file, "rb") as f:
+            logger.debug(f"Loaded stylesheet from disk cache: {cache_file}")
+            return f.read().decode("utf-8")
+    except FileNotFoundError:
+        return None
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning(f"Failed to read stylesheet cache '{cache_file}': {e}")
+        return None
+
+
+def _write_theme_disk_cache(theme_name: str, cache_file: str, content: str) -> None:
+    """原子地写入磁盘缓存，并清理该主题过期的缓存文件。失败不影响主题应用。"""
+    try:
+        os.makedirs(THEME_CACHE_DIR, exist_ok=True)
+        for stale_file in glob.glob(
+            os.path.join(THEME_CACHE_DIR, f"theme_{theme_name}_*.qss")
+        ):
+            if stale_file != cache_file:
+                os.remove(stale_file)
+
+        temp_file = cache_file + ".tmp"
+        with open(temp_file, "wb") as f:
+            f.write(content.encode("utf-8"))
+        os.replace(temp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write stylesheet cache '{cache_file}': {e}")
+
+
 def apply_theme(app: QApplication, theme_name: str) -> None:
     """
     从文件加载并应用指定的主题样式表到整个应用程序。
     此函数现在会手动处理 @import 和 url() 语句。
     """
+    global _ACTIVE_THEME
+
     if theme_name not in THEMES:
         logger.warning(f"Attempted to apply non-existent theme: '{theme_name}'")
         return
-
-    theme_files = THEMES[theme_name]
+    if theme_name == _ACTIVE_THEME:
+        logger.debug(f"'{theme_name}' theme is already active, skipping.")
+        return
 
     try:
         logger.info(f"Applying '{theme_name}' theme...")
 
-        style_qss = _load_and_parse_qss(theme_files["style"])
-        app_ui_qss = _load_and_parse_qss(theme_files["app_ui"])
-
-        full_stylesheet = style_qss + "\n" + app_ui_qss
+        full_stylesheet = _get_theme_stylesheet(theme_name)
 
         app.setStyleSheet(full_stylesheet)
+        _ACTIVE_THEME = theme_name
         logger.info(f"'{theme_name}' theme applied successfully.")
 
     except Exception as e:
         logger.error(f"Error applying theme '{theme_name}': {e}", exc_info=True)
+    else:
+        _schedule_theme_preload(exclude=theme_name)
+
+
+def _schedule_theme_preload(exclude: str) -> None:
+    """
+    在后台线程中预先解析其余主题的样式表。
+
+    用户之后切换主题（包括设置对话框中的预览）时，_get_theme_stylesheet
+    会直接命中 _FULL_SHEET_CACHE，主线程只需执行 setStyleSheet。
+    后台任务只会向模块级缓存字典写入完整的结果，与主线程并发执行时
+    最坏情况也只是同一个文件被重复解析一次。
+    """
+    # 延迟导入，task_manager 只在确实需要预解析时才加载
+    from .task_manager import task_manager
+
+    for other in THEMES:
+        if (
+            other == exclude
+            or other in _FULL_SHEET_CACHE
+            or other in _PRELOAD_SCHEDULED
+        ):
+            continue
+        _PRELOAD_SCHEDULED.add(other)
+        logger.debug(f"Scheduling background pre-parse of '{other}' theme.")
+        task_manager.run_in_background(
+            _get_theme_stylesheet,
+            on_error=lambda _err, name=other: _PRELOAD_SCHEDULED.discard(name),
+            theme_name=other,
+        )
@@ -11,9 +11,15 @@ from core.crypto import CryptoHandler
 from language import t
 from ui.dialogs.message_box_dialog import CustomMessageBox
 from ui.task_manager import task_manager
+from utils.password_policy import is_password_strong
 
 logger = logging.getLogger(__name__)
 
+# retranslate_ui 中按模式使用的翻译键，依次对应
+# (欢迎语, 密码输入框占位符, 主按钮文本)
+_SETUP_KEYS = ("setup_instruction", "setup_placeholder", "setup_button")
+_UNLOCK_KEYS = ("unlock_welcome", "unlock_placeholder", "unlock_button")
+
 
 class UnlockScreen(QWidget):
     unlocked = pyqtSignal()
@@ -58,6 +64,14 @@ class UnlockScreen(QWidget):
         self.exit_button.setObjectName("unlockExitButton")
         self.exit_button.clicked.connect(self.exit_requested.emit)  # 修改
 
+        # 后台任务运行期间需要禁用的控件
+        self._lockable = (
+            self.password_input,
+            self.confirm_password_input,
+            self.action_button,
+        )
+        self._locked_state = False
+
         layout.addWidget(self.logo_label)
         layout.addWidget(self.welcome_label)
         layout.addWidget(self.password_input)
@@ -69,17 +83,15 @@ class UnlockScreen(QWidget):
         self.update_ui_for_mode()
 
     def retranslate_ui(self) -> None:
+        keys = _SETUP_KEYS if self.is_setup_mode else _UNLOCK_KEYS
+        welcome, placeholder, button = [t.get(key) for key in keys]
+        self.welcome_label.setText(welcome)
+        self.password_input.setPlaceholderText(placeholder)
+        self.action_button.setText(button)
         if self.is_setup_mode:
-            self.welcome_label.setText(t.get("setup_instruction"))
-            self.password_input.setPlaceholderText(t.get("setup_placeholder"))
             self.confirm_password_input.setPlaceholderText(
                 t.get("setup_confirm_placeholder")
             )
-            self.action_button.setText(t.get("setup_button"))
-        else:
-            self.welcome_label.setText(t.get("unlock_welcome"))
-            self.password_input.setPlaceholderText(t.get("unlock_placeholder"))
-            self.action_button.setText(t.get("unlock_button"))
 
         self.logo_label.setText(t.get("app_title"))
         self.exit_button.setText(t.get("button_exit"))
@@ -88,18 +100,14 @@ class UnlockScreen(QWidget):
         self.retranslate_ui()
         self.confirm_password_input.setVisible(self.is_setup_mode)
 
-    def _validate_password(self, password: str) -> bool:
-        return (
-            len(password) >= 8
-            and any(c.isupper() for c in password)
-            and any(c.islower() for c in password)
-            and any(c.isdigit() for c in password)
-        )
-
     def _set_ui_locked(self, locked: bool) -> None:
-        self.password_input.setEnabled(not locked)
-        self.confirm_password_input.setEnabled(not locked)
-        self.action_button.setEnabled(not locked)
+        if locked == self._locked_state:
+            return
+        self._locked_state = locked
+
+        enabled = not locked
+        for widget in self._lockable:
+            widget.setEnabled(enabled)
         if locked:
             self.setCursor(QCursor(Qt.CursorShape.WaitCursor))
         else:
@@ -107,29 +115,30 @@ class UnlockScreen(QWidget):
 
     def _attempt_unlock(self) -> None:
         password = self.password_input.text()
-        self._set_ui_locked(True)
+        # 先完成同步校验，只有真正启动后台任务时才锁定界面，
+        # 校验失败时不会产生一次多余的锁定/解锁
         if self.is_setup_mode:
             confirm_password = self.confirm_password_input.text()
             if password != confirm_password:
                 CustomMessageBox.information(
                     self, t.get("error_title_mismatch"), t.get("error_msg_mismatch")
                 )
-                self._set_ui_locked(False)
                 return
-            if not self._validate_password(password):
+            if not is_password_strong(password):
                 CustomMessageBox.information(
                     self,
                     t.get("error_title_weak_password"),
                     t.get("error_msg_weak_password"),
                 )
-                self._set_ui_locked(False)
                 return
+            self._set_ui_locked(True)
             task_manager.run_in_background(
                 self.crypto.set_master_password,
                 on_success=self._on_setup_success,
                 password=password,
             )
         else:
+            self._set_ui_locked(True)
             task_manager.run_in_background(
                 self.crypto.unlock_with_master_password,
                 on_success=self._on_unlock_result,
@@ -147,7 +156,7 @@ class UnlockScreen(QWidget):
             )
             self.password_input.clear()
 
-    def _on_unlock_error(self, err: Exception, tb: str) -> None:
+    def _on_unlock_error(self, err: Exception) -> None:
         self._set_ui_locked(False)
         CustomMessageBox.information(self, t.get("error_title_generic"), str(err))
 
@@ -11,148 +11,232 @@ from PyQt6.QtWidgets import (
     QLineEdit,
     QPushButton,
     QFrame,
-    QTextEdit,
     QTabWidget,
-    QLayout,
-    QLayoutItem,
 )
 from PyQt6.QtCore import Qt, QTimer, QSize, pyqtSignal
+from PyQt6.QtGui import QPixmap, QPixmapCache
 
 from language import t
 from utils import clipboard_manager, icon_cache
 from core.icon_fetcher import IconFetcher
 from ..components.two_fa_widget import TwoFAWidget
-from ..components.custom_widgets import StyledTextEdit
 
 logger = logging.getLogger(__name__)
 
+# 详情区域用到的全部翻译键。它们在 DetailsView.retranslate_ui 中一次性解析为
+# 字符串缓存，再传递给各个面板和字段，切换条目时无需重复查找翻译。
+_DETAIL_STRING_KEYS = (
+    "details_placeholder",
+    "tab_main",
+    "tab_security",
+    "tab_info",
+    "label_user",
+    "label_email",
+    "label_pass",
+    "label_backup_codes",
+    "label_url",
+    "label_notes",
+    "label_2fa_code",
+    "button_edit_icon",
+    "button_delete_icon",
+    "button_show",
+    "button_hide",
+    "button_copy",
+    "button_copied",
+)
 
-class DetailsView(QWidget):
-    edit_requested = pyqtSignal(int)
-    delete_requested = pyqtSignal(int)
 
-    def __init__(self, parent: Optional[QWidget] = None):
-        super().__init__(parent)
-        self.current_entry_group: List[Dict[str, Any]] = []
-        self.active_entry_in_group: Optional[Dict[str, Any]] = None
-        self.main_layout = QVBoxLayout(self)
-        self.main_layout.setContentsMargins(15, 0, 0, 0)
-        self.main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.clear_details()
+def _build_string_cache() -> Dict[str, str]:
+    return t.snapshot(_DETAIL_STRING_KEYS)
 
-    def display_entry_group(self, entries: List[Dict[str, Any]]) -> None:
-        if not entries:
-            self.clear_details()
-            return
 
-        self.current_entry_group = sorted(
-            entries, key=lambda x: x.get("details", {}).get("username", "")
-        )
-        self._clear_layout_widgets()
-        self.main_layout.setSpacing(15)
+_EMPTY_DETAILS: Dict[str, Any] = {}
 
-        representative_entry = self.current_entry_group[0]
-        self.main_layout.addLayout(self._create_shared_header(representative_entry))
 
-        if len(self.current_entry_group) == 1:
-            self.active_entry_in_group = self.current_entry_group[0]
-            details_tabs = self._create_details_widget_for_entry(
-                self.active_entry_in_group
-            )
-            self.main_layout.addWidget(details_tabs, 1)
-        else:
-            account_tabs = QTabWidget()
-            for entry in self.current_entry_group:
-                details_widget = self._create_details_widget_for_entry(entry)
-                username = entry.get("details", {}).get(
-                    "username", f"Account ID: {entry['id']}"
-                )
-                account_tabs.addTab(details_widget, username)
+def _username_of(entry: Dict[str, Any]) -> str:
+    # 排序键函数：缺少 details 时使用共享的空字典，不为每次比较分配新字典
+    return (entry.get("details") or _EMPTY_DETAILS).get("username", "")
 
-            account_tabs.currentChanged.connect(self._on_account_tab_changed)
-            self._on_account_tab_changed(0)
-            self.main_layout.addWidget(account_tabs, 1)
 
-    def retranslate_ui(self) -> None:
-        if self.current_entry_group:
-            self.display_entry_group(self.current_entry_group)
-        else:
-            self.clear_details()
+class DetailField(QFrame):
+    """
+    详情面板中的一个只读字段（标题、值以及内联操作按钮）。
+    控件只构建一次，切换条目时仅通过 `set_value` 更新文本和可见性。
+    """
 
-    def _on_account_tab_changed(self, index: int) -> None:
-        if 0 <= index < len(self.current_entry_group):
-            self.active_entry_in_group = self.current_entry_group[index]
+    COPY_FEEDBACK_MS = 1500
 
-    def _create_shared_header(self, entry: Dict[str, Any]) -> QHBoxLayout:
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(15)
-        icon_label = QLabel()
-        icon_label.setFixedSize(52, 52)
-        icon_label.setScaledContents(True)
-        pixmap = IconFetcher.pixmap_from_base64(
-            entry.get("details", {}).get("icon_data")
-        )
-        icon_label.setPixmap(pixmap)
-        name_label = QLabel(str(entry.get("name", "")))
-        name_label.setObjectName("detailsNameLabel")
-        name_label.setWordWrap(True)
-        header_layout.addWidget(icon_label)
-        header_layout.addWidget(name_label)
-        header_layout.addStretch()
-        edit_button = self._create_action_button(
-            "detailsActionButton", "edit", t.get("button_edit_icon")
-        )
-        delete_button = self._create_action_button(
-            "detailsActionButton", "delete", t.get("button_delete_icon")
-        )
-        edit_button.clicked.connect(
-            lambda: (
-                self.edit_requested.emit(self.active_entry_in_group["id"])
-                if self.active_entry_in_group
-                else None
+    def __init__(
+        self,
+        title_key: str,
+        strings: Dict[str, str],
+        is_password: bool = False,
+        multiline: bool = False,
+        is_sensitive: bool = False,
+        parent: Optional[QWidget] = None,
+    ):
+        super().__init__(parent)
+        self.setObjectName("detailField")
+        self.title_key = title_key
+        self.is_sensitive = is_password or is_sensitive
+        self._value = ""
+
+        layout = QVBoxLayout(self)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("fieldTitleLabel")
+        value_layout = QHBoxLayout()
+        self.value_display: QLineEdit | QLabel
+
+        if multiline:
+            # 只读的多行文本用可选择的 QLabel 显示，不需要 QTextEdit 的
+            # 文档模型、撤销栈和光标。复制按钮会复制完整内容。
+            self.value_display = QLabel()
+            self.value_display.setObjectName("fieldValueDisplay")
+            self.value_display.setTextFormat(Qt.TextFormat.PlainText)
+            self.value_display.setWordWrap(True)
+            self.value_display.setTextInteractionFlags(
+                Qt.TextInteractionFlag.TextSelectableByMouse
+                | Qt.TextInteractionFlag.TextSelectableByKeyboard
             )
-        )
-        delete_button.clicked.connect(
-            lambda: (
-                self.delete_requested.emit(self.active_entry_in_group["id"])
-                if self.active_entry_in_group
-                else None
+        else:
+            self.value_display = QLineEdit()
+            self.value_display.setReadOnly(True)
+            self.value_display.setObjectName("fieldValueDisplay")
+            if is_password:
+                self.value_display.setEchoMode(QLineEdit.EchoMode.Password)
+
+        value_layout.addWidget(self.value_display, 1)
+
+        self.show_hide_btn: Optional[QPushButton] = None
+        if is_password:
+            self.show_hide_btn = QPushButton()
+            self.show_hide_btn.setObjectName("inlineButton")
+            self.show_hide_btn.setCheckable(True)
+            self.show_hide_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            self.show_hide_btn.toggled.connect(self._toggle_password_visibility)
+            value_layout.addWidget(self.show_hide_btn)
+
+        self.copy_btn = QPushButton()
+        self.copy_btn.setObjectName("inlineButton")
+        self.copy_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.copy_btn.clicked.connect(self._copy_to_clipboard)
+        value_layout.addWidget(self.copy_btn)
+
+        # 复制反馈使用一个持久的单次定时器，不为每次点击创建新的定时器
+        self._copy_feedback_timer = QTimer(self)
+        self._copy_feedback_timer.setSingleShot(True)
+        self._copy_feedback_timer.setInterval(self.COPY_FEEDBACK_MS)
+        self._copy_feedback_timer.timeout.connect(self._restore_copy_button)
+
+        layout.addWidget(self.title_label)
+        layout.addLayout(value_layout)
+        self.retranslate_ui(strings)
+
+    def set_value(self, value: str) -> None:
+        self._value = value
+        self.value_display.setText(value)
+
+        # 切换到新条目时，密码始终恢复为隐藏状态
+        if self.show_hide_btn is not None and self.show_hide_btn.isChecked():
+            self.show_hide_btn.setChecked(False)
+
+        # 上一个条目的复制反馈不应延续到新条目上
+        if self._copy_feedback_timer.isActive():
+            self._copy_feedback_timer.stop()
+            self._restore_copy_button()
+
+        self.setVisible(bool(value))
+
+    def retranslate_ui(self, strings: Dict[str, str]) -> None:
+        # 交互时直接使用这里保存的按钮文本
+        self._str_show = strings["button_show"]
+        self._str_hide = strings["button_hide"]
+        self._str_copy = strings["button_copy"]
+        self._str_copied = strings["button_copied"]
+
+        self.title_label.setText(strings[self.title_key])
+        if self.show_hide_btn is not None:
+            self.show_hide_btn.setText(
+                self._str_hide if self.show_hide_btn.isChecked() else self._str_show
             )
+        if self.copy_btn.isEnabled():
+            self.copy_btn.setText(self._str_copy)
+
+    def _toggle_password_visibility(self, checked: bool) -> None:
+        if not isinstance(self.value_display, QLineEdit) or not self.show_hide_btn:
+            return
+        self.value_display.setEchoMode(
+            QLineEdit.EchoMode.Normal if checked else QLineEdit.EchoMode.Password
         )
-        header_layout.addWidget(edit_button)
-        header_layout.addSpacing(10)
-        header_layout.addWidget(delete_button)
-        return header_layout
+        self.show_hide_btn.setText(self._str_hide if checked else self._str_show)
 
-    def _create_action_button(
-        self, obj_name: str, icon_key: str, tooltip: str
-    ) -> QPushButton:
-        button = QPushButton()
-        button.setObjectName(obj_name)
-        button.setFixedSize(40, 40)
-        button.setIcon(icon_cache.get(icon_key))
-        button.setIconSize(QSize(22, 22))
-        button.setToolTip(tooltip)
-        return button
+    def _copy_to_clipboard(self) -> None:
+        clipboard_manager.copy(self._value, is_sensitive=self.is_sensitive)
+        self.copy_btn.setText(self._str_copied)
+        self.copy_btn.setEnabled(False)
+        self._copy_feedback_timer.start()
+
+    def _restore_copy_button(self) -> None:
+        self.copy_btn.setText(self._str_copy)
+        self.copy_btn.setEnabled(True)
 
-    def _create_details_widget_for_entry(self, entry: Dict[str, Any]) -> QWidget:
-        container = QWidget()
-        container_layout = QVBoxLayout(container)
+
+class TwoFAField(QFrame):
+    """
+    显示 TOTP 代码的详情字段。内部的 TwoFAWidget 在第一次遇到带密钥的
+    条目时才创建，之后在条目之间复用；大多数条目没有 2FA，
+    无需为它们分配控件和定时器。
+    """
+
+    def __init__(self, strings: Dict[str, str], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setObjectName("detailField")
+        self._layout = QVBoxLayout(self)
+        self.title_label = QLabel()
+        self.title_label.setObjectName("fieldTitleLabel")
+        self.two_fa_widget: Optional[TwoFAWidget] = None
+        self._layout.addWidget(self.title_label)
+        self.retranslate_ui(strings)
+
+    def set_secret(self, secret: str) -> None:
+        if self.two_fa_widget is None:
+            if not secret:
+                self.setVisible(False)
+                return
+            self.two_fa_widget = TwoFAWidget(secret)
+            self._layout.addWidget(self.two_fa_widget)
+        else:
+            self.two_fa_widget.set_secret(secret)
+        self.setVisible(bool(secret))
+
+    def retranslate_ui(self, strings: Dict[str, str]) -> None:
+        self.title_label.setText(strings["label_2fa_code"])
+        if self.two_fa_widget is not None:
+            self.two_fa_widget.retranslate_ui()
+
+
+class EntryDetailsPanel(QWidget):
+    """
+    单个条目的详情选项卡（主要信息 / 安全 / 其他信息）。
+    整个控件树只构建一次，`set_entry` 只负责更新内容。
+    """
+
+    def __init__(self, strings: Dict[str, str], parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        container_layout = QVBoxLayout(self)
         container_layout.setContentsMargins(0, 0, 0, 0)
 
-        tabs = QTabWidget()
-        container_layout.addWidget(tabs)
-        
+        self.tabs = QTabWidget()
+        container_layout.addWidget(self.tabs)
+
         main_tab = QWidget()
         security_tab = QWidget()
         info_tab = QWidget()
 
-        tabs.addTab(main_tab, t.get("tab_main"))
-        tabs.addTab(security_tab, t.get("tab_security"))
-        tabs.addTab(info_tab, t.get("tab_info"))
+        self.tabs.addTab(main_tab, "")
+        self.tabs.addTab(security_tab, "")
+        self.tabs.addTab(info_tab, "")
 
-        details = entry.get("details", {})
-        
         main_layout = QVBoxLayout(main_tab)
         main_layout.setContentsMargins(0, 15, 0, 0)
         main_layout.setSpacing(15)
@@ -167,175 +251,330 @@ class DetailsView(QWidget):
         info_layout.setContentsMargins(0, 15, 0, 0)
         info_layout.setSpacing(15)
         info_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        # --- MODIFICATION START: Directly get text from storage without conversion ---
-        backup_codes_text = details.get("backup_codes", "")
-        notes_text = details.get("notes", "")
-        # --- MODIFICATION END ---
 
-        username_field = self._create_detail_field(
-            t.get("label_user"), details.get("username", "")
-        )
-        email_field = self._create_detail_field(
-            t.get("label_email"), details.get("email", "")
-        )
-        password_field = self._create_detail_field(
-            t.get("label_pass"), details.get("password", ""), is_password=True
+        self.username_field = DetailField("label_user", strings)
+        self.email_field = DetailField("label_email", strings)
+        self.password_field = DetailField("label_pass", strings, is_password=True)
+        self.two_fa_field = TwoFAField(strings)
+        self.backup_codes_field = DetailField(
+            "label_backup_codes", strings, multiline=True, is_sensitive=True
         )
-        two_fa_field = self._create_2fa_field(details.get("totp_secret", ""))
-        
-        backup_codes_field = self._create_detail_field(
-            t.get("label_backup_codes"), backup_codes_text, multiline=True
-        )
-        url_field = self._create_detail_field(
-            t.get("label_url"), details.get("url", "")
-        )
-        notes_field = self._create_detail_field(
-            t.get("label_notes"), notes_text, multiline=True
-        )
-        
-        main_layout.addWidget(username_field)
-        main_layout.addWidget(email_field)
-        main_layout.addWidget(password_field)
+        self.url_field = DetailField("label_url", strings)
+        self.notes_field = DetailField("label_notes", strings, multiline=True)
+
+        main_layout.addWidget(self.username_field)
+        main_layout.addWidget(self.email_field)
+        main_layout.addWidget(self.password_field)
         main_layout.addStretch()
-        
-        security_layout.addWidget(two_fa_field)
-        security_layout.addWidget(backup_codes_field)
+
+        security_layout.addWidget(self.two_fa_field)
+        security_layout.addWidget(self.backup_codes_field)
         security_layout.addStretch()
-        
-        info_layout.addWidget(url_field)
-        info_layout.addWidget(notes_field)
+
+        info_layout.addWidget(self.url_field)
+        info_layout.addWidget(self.notes_field)
         info_layout.addStretch()
-        
-        username_field.setVisible(bool(details.get("username")))
-        email_field.setVisible(bool(details.get("email")))
-        password_field.setVisible(bool(details.get("password")))
-        two_fa_field.setVisible(bool(details.get("totp_secret")))
-        backup_codes_field.setVisible(bool(details.get("backup_codes")))
-        url_field.setVisible(bool(details.get("url")))
-        notes_field.setVisible(bool(details.get("notes")))
-        
-        has_security_info = bool(details.get("totp_secret")) or bool(
-            details.get("backup_codes")
-        )
-        tabs.setTabVisible(1, has_security_info)
-        
-        has_info = bool(details.get("url")) or bool(details.get("notes"))
-        tabs.setTabVisible(2, has_info)
-
-        return container
-
-    def _create_detail_field(
-        self, title: str, value: str, is_password: bool = False, multiline: bool = False
-    ) -> QFrame:
-        field_frame = QFrame()
-        field_frame.setObjectName("detailField")
-        layout = QVBoxLayout(field_frame)
-        title_label = QLabel(title)
-        title_label.setObjectName("fieldTitleLabel")
-        value_layout = QHBoxLayout()
-        value_display: QLineEdit | QTextEdit
 
-        if multiline:
-            # This is the correct way to display multiline text
-            value_display = StyledTextEdit()
-            value_display.setPlainText(value)
-            value_display.setReadOnly(True)
-            value_display.setObjectName("fieldValueDisplay")
+        self.retranslate_ui(strings)
+
+    def set_entry(self, entry: Dict[str, Any]) -> None:
+        details = entry.get("details", {})
+        totp_secret = details.get("totp_secret", "")
+        backup_codes = details.get("backup_codes", "")
+        url = details.get("url", "")
+        notes = details.get("notes", "")
+
+        # --- MODIFICATION START: Directly get text from storage without conversion ---
+        self.username_field.set_value(details.get("username", ""))
+        self.email_field.set_value(details.get("email", ""))
+        self.password_field.set_value(details.get("password", ""))
+        self.two_fa_field.set_secret(totp_secret)
+        self.backup_codes_field.set_value(backup_codes)
+        self.url_field.set_value(url)
+        self.notes_field.set_value(notes)
+        # --- MODIFICATION END ---
+
+        self.tabs.setTabVisible(1, bool(totp_secret or backup_codes))
+        self.tabs.setTabVisible(2, bool(url or notes))
+
+        self.tabs.setCurrentIndex(0)
+
+    def clear(self) -> None:
+        """
+        清空面板显示的全部内容。面板隐藏后会留在内存中等待复用，
+        不能继续持有上一个条目的密码、备用码和 2FA 密钥。
+        """
+        self.set_entry({})
+
+    def retranslate_ui(self, strings: Dict[str, str]) -> None:
+        self.tabs.setTabText(0, strings["tab_main"])
+        self.tabs.setTabText(1, strings["tab_security"])
+        self.tabs.setTabText(2, strings["tab_info"])
+        for field in (
+            self.username_field,
+            self.email_field,
+            self.password_field,
+            self.two_fa_field,
+            self.backup_codes_field,
+            self.url_field,
+            self.notes_field,
+        ):
+            field.retranslate_ui(strings)
+
+
+class DetailsView(QWidget):
+    edit_requested = pyqtSignal(int)
+    delete_requested = pyqtSignal(int)
+
+    # 连续切换条目（例如按住方向键浏览列表）时，合并渲染请求的时间窗口
+    RENDER_DEBOUNCE_MS = 40
+    HEADER_ICON_SIZE = 52
+    ACTION_ICON_SIZE = QSize(22, 22)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.current_entry_group: List[Dict[str, Any]] = []
+        self.active_entry_in_group: Optional[Dict[str, Any]] = None
+
+        self._pending_entries: Optional[List[Dict[str, Any]]] = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(self.RENDER_DEBOUNCE_MS)
+        self._render_timer.timeout.connect(self._render_pending)
+
+        # 语言切换时可能连续触发多次重新翻译，合并为事件循环中的一次
+        self._retranslate_pending = False
+
+        self.main_layout = QVBoxLayout(self)
+        self.main_layout.setContentsMargins(15, 0, 0, 0)
+        self.main_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self._build_details_widgets()
+        self.clear_details()
+
+    def _build_details_widgets(self) -> None:
+        """
+        一次性构建详情区域的全部控件。之后切换条目时只更新文本、
+        图标和可见性，而不是销毁并重建整棵控件树。
+        """
+        self._str_cache = _build_string_cache()
+
+        self.placeholder = QLabel()
+        self.placeholder.setObjectName("placeholderLabel")
+        self.placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self._details_root = QWidget()
+        root_layout = QVBoxLayout(self._details_root)
+        root_layout.setContentsMargins(0, 0, 0, 0)
+        root_layout.setSpacing(15)
+        root_layout.addLayout(self._create_shared_header())
+
+        self._single_panel = EntryDetailsPanel(self._str_cache)
+        root_layout.addWidget(self._single_panel, 1)
+
+        # 多账户分组的选项卡容器同样只创建一次。每个账户的详情面板放在
+        # 一个按位置复用的池中，只有分组比以往任何一次都大时才会创建新面板。
+        self._account_tabs = QTabWidget()
+        self._account_tabs.currentChanged.connect(self._on_account_tab_changed)
+        self._account_tabs.hide()
+        self._account_panels: List[EntryDetailsPanel] = []
+        root_layout.addWidget(self._account_tabs, 1)
+
+        self.main_layout.addWidget(self.placeholder, 1, Qt.AlignmentFlag.AlignCenter)
+        self.main_layout.addWidget(self._details_root, 1)
+        self._apply_view_strings()
+
+    def display_entry_group(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        显示一组条目。单独的一次选择会立即渲染；在上一次渲染后的短时间内
+        到达的请求只保留最后一个，在窗口结束时渲染。
+        """
+        if not entries:
+            self.clear_details()
+            return
+
+        if self._render_timer.isActive():
+            self._pending_entries = entries
+            self._render_timer.start()
+            return
+
+        self._render_entry_group(entries)
+        self._render_timer.start()
+
+    def _render_pending(self) -> None:
+        entries = self._pending_entries
+        self._pending_entries = None
+        if entries is not None:
+            self._render_entry_group(entries)
+
+    def _render_entry_group(self, entries: List[Dict[str, Any]]) -> None:
+        if len(entries) == 1:
+            # 最常见的情况：单个条目无需排序
+            self.current_entry_group = list(entries)
         else:
-            value_display = QLineEdit(value)
-            value_display.setReadOnly(True)
-            value_display.setObjectName("fieldValueDisplay")
-            if is_password:
-                value_display.setEchoMode(QLineEdit.EchoMode.Password)
+            self.current_entry_group = sorted(entries, key=_username_of)
 
-        value_layout.addWidget(value_display, 1)
+        representative_entry = self.current_entry_group[0]
+        self._update_shared_header(representative_entry)
 
-        if is_password:
-            show_hide_btn = QPushButton(t.get("button_show"))
-            show_hide_btn.setObjectName("inlineButton")
-            show_hide_btn.setCheckable(True)
-            show_hide_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            show_hide_btn.toggled.connect(
-                lambda checked, v=value_display, b=show_hide_btn: (
-                    self._toggle_password_visibility(checked, v, b)
-                    if isinstance(v, QLineEdit) else None
+        if len(self.current_entry_group) == 1:
+            self._account_tabs.hide()
+            self._trim_account_tabs(0)
+            self.active_entry_in_group = self.current_entry_group[0]
+            self._single_panel.set_entry(self.active_entry_in_group)
+            self._single_panel.show()
+        else:
+            self._single_panel.hide()
+            self._single_panel.clear()
+            self._show_account_tabs(self.current_entry_group)
+
+        self.placeholder.hide()
+        self._details_root.show()
+
+    def retranslate_ui(self) -> None:
+        if self._retranslate_pending:
+            return
+        self._retranslate_pending = True
+        QTimer.singleShot(0, self._apply_retranslate)
+
+    def _apply_retranslate(self) -> None:
+        self._retranslate_pending = False
+        self._str_cache = _build_string_cache()
+        self._apply_view_strings()
+        self._single_panel.retranslate_ui(self._str_cache)
+        for panel in self._account_panels:
+            panel.retranslate_ui(self._str_cache)
+
+    def _show_account_tabs(self, entries: List[Dict[str, Any]]) -> None:
+        """把分组中的账户填入复用的选项卡，多余的选项卡被移除但面板保留在池中。"""
+        tabs = self._account_tabs
+        tabs.blockSignals(True)
+        try:
+            while len(self._account_panels) < len(entries):
+                self._account_panels.append(EntryDetailsPanel(self._str_cache))
+            self._trim_account_tabs(len(entries))
+
+            for index, entry in enumerate(entries):
+                panel = self._account_panels[index]
+                panel.set_entry(entry)
+                username = entry.get("details", {}).get(
+                    "username", f"Account ID: {entry['id']}"
                 )
-            )
-            value_layout.addWidget(show_hide_btn)
-
-        copy_btn = QPushButton(t.get("button_copy"))
-        copy_btn.setObjectName("inlineButton")
-        copy_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        is_sensitive = is_password or title == t.get("label_backup_codes")
-        copy_btn.clicked.connect(
-            lambda: self._copy_to_clipboard(value, copy_btn, is_sensitive)
+                if index < tabs.count():
+                    tabs.setTabText(index, username)
+                else:
+                    tabs.addTab(panel, username)
+            tabs.setCurrentIndex(0)
+        finally:
+            tabs.blockSignals(False)
+
+        self._on_account_tab_changed(0)
+        tabs.show()
+
+    def _trim_account_tabs(self, count: int) -> None:
+        """
+        移除多余的账户选项卡。removeTab 不会销毁面板，它们留在池中供下一次
+        使用，因此移除时清空其内容，不让上一个分组的敏感信息留在隐藏的控件中。
+        """
+        tabs = self._account_tabs
+        while tabs.count() > count:
+            index = tabs.count() - 1
+            tabs.removeTab(index)
+            self._account_panels[index].clear()
+
+    def _apply_view_strings(self) -> None:
+        strings = self._str_cache
+        self.placeholder.setText(strings["details_placeholder"])
+        self.edit_button.setToolTip(strings["button_edit_icon"])
+        self.delete_button.setToolTip(strings["button_delete_icon"])
+
+    def _on_account_tab_changed(self, index: int) -> None:
+        if 0 <= index < len(self.current_entry_group):
+            self.active_entry_in_group = self.current_entry_group[index]
+
+    def _create_shared_header(self) -> QHBoxLayout:
+        header_layout = QHBoxLayout()
+        header_layout.setSpacing(15)
+        self.icon_label = QLabel()
+        self.icon_label.setFixedSize(self.HEADER_ICON_SIZE, self.HEADER_ICON_SIZE)
+        self.name_label = QLabel()
+        self.name_label.setObjectName("detailsNameLabel")
+        self.name_label.setWordWrap(True)
+        header_layout.addWidget(self.icon_label)
+        header_layout.addWidget(self.name_label)
+        header_layout.addStretch()
+        self.edit_button = self._create_action_button("detailsActionButton", "edit")
+        self.delete_button = self._create_action_button(
+            "detailsActionButton", "delete"
         )
-        value_layout.addWidget(copy_btn)
+        self.edit_button.clicked.connect(self._on_edit_clicked)
+        self.delete_button.clicked.connect(self._on_delete_clicked)
+        header_layout.addWidget(self.edit_button)
+        header_layout.addSpacing(10)
+        header_layout.addWidget(self.delete_button)
+        return header_layout
 
-        layout.addWidget(title_label)
-        layout.addLayout(value_layout)
-        return field_frame
-
-    def _create_2fa_field(self, secret: str) -> QFrame:
-        field_frame = QFrame()
-        field_frame.setObjectName("detailField")
-        layout = QVBoxLayout(field_frame)
-        title_label = QLabel(t.get("label_2fa_code"))
-        title_label.setObjectName("fieldTitleLabel")
-        two_fa_widget = TwoFAWidget(secret)
-        layout.addWidget(title_label)
-        layout.addWidget(two_fa_widget)
-        return field_frame
+    def _flush_pending_render(self) -> None:
+        """
+        立即完成尚在等待中的渲染。在防抖窗口内 active_entry_in_group
+        仍指向上一次显示的条目，编辑和删除之前必须先与最新的选择同步。
+        """
+        if self._render_timer.isActive():
+            self._render_timer.stop()
+            self._render_pending()
+
+    def _on_edit_clicked(self) -> None:
+        self._flush_pending_render()
+        if self.active_entry_in_group:
+            self.edit_requested.emit(self.active_entry_in_group["id"])
+
+    def _on_delete_clicked(self) -> None:
+        self._flush_pending_render()
+        if self.active_entry_in_group:
+            self.delete_requested.emit(self.active_entry_in_group["id"])
+
+    def _update_shared_header(self, entry: Dict[str, Any]) -> None:
+        pixmap = IconFetcher.pixmap_from_base64(
+            entry.get("details", {}).get("icon_data")
+        )
+        self.icon_label.setPixmap(self._scaled_header_pixmap(pixmap))
+        self.name_label.setText(str(entry.get("name", "")))
+
+    def _scaled_header_pixmap(self, pixmap: QPixmap) -> QPixmap:
+        """
+        返回缩放到标题图标尺寸的图标。缩放结果放入 QPixmapCache，
+        标签不再使用 setScaledContents 在每次绘制时重新缩放。
+        """
+        dpr = self.devicePixelRatioF()
+        key = f"detailsHeaderIcon:{pixmap.cacheKey()}:{self.HEADER_ICON_SIZE}@{dpr}"
+        scaled = QPixmapCache.find(key)
+        if scaled is None:
+            device_size = round(self.HEADER_ICON_SIZE * dpr)
+            scaled = pixmap.scaled(
+                device_size,
+                device_size,
+                Qt.AspectRatioMode.KeepAspectRatio,
+                Qt.TransformationMode.SmoothTransformation,
+            )
+            scaled.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(key, scaled)
+        return scaled
+
+    def _create_action_button(self, obj_name: str, icon_key: str) -> QPushButton:
+        button = QPushButton()
+        button.setObjectName(obj_name)
+        button.setFixedSize(40, 40)
+        button.setIcon(icon_cache.get(icon_key))
+        button.setIconSize(self.ACTION_ICON_SIZE)
+        return button
 
     def clear_details(self) -> None:
+        self._render_timer.stop()
+        self._pending_entries = None
         self.current_entry_group = []
         self.active_entry_in_group = None
-        self._clear_layout_widgets()
-        placeholder = QLabel(t.get("details_placeholder"))
-        placeholder.setObjectName("placeholderLabel")
-        placeholder.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.main_layout.addWidget(placeholder, 1, Qt.AlignmentFlag.AlignCenter)
-
-    def _toggle_password_visibility(
-        self, checked: bool, display_widget: QLineEdit, button: QPushButton
-    ) -> None:
-        display_widget.setEchoMode(
-            QLineEdit.EchoMode.Normal if checked else QLineEdit.EchoMode.Password
-        )
-        button.setText(t.get("button_hide") if checked else t.get("button_show"))
-
-    def _copy_to_clipboard(
-        self, text: str, button: QPushButton, is_sensitive: bool
-    ) -> None:
-        clipboard_manager.copy(text, is_sensitive=is_sensitive)
-        original_text = button.text()
-        button.setText(t.get("button_copied"))
-        button.setEnabled(False)
-        QTimer.singleShot(
-            1500, lambda: (button.setText(original_text), button.setEnabled(True))
-        )
-
-    def _clear_layout_widgets(self) -> None:
-        while self.main_layout.count():
-            child: Optional[QLayoutItem] = self.main_layout.takeAt(0)
-            if child:
-                widget = child.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    layout = child.layout()
-                    if layout:
-                        self._clear_recursive(layout)
-
-    def _clear_recursive(self, layout: QLayout) -> None:
-        while layout.count():
-            child: Optional[QLayoutItem] = layout.takeAt(0)
-            if child:
-                widget = child.widget()
-                if widget:
-                    widget.deleteLater()
-                else:
-                    sub_layout = child.layout()
-                    if sub_layout:
-                        self._clear_recursive(sub_layout)
\ No newline at end of file
+        self._account_tabs.hide()
+        self._details_root.hide()
+        self.placeholder.show()
+        # 隐藏的面板会被保留复用，清空其中上一个条目的敏感信息
+        self._single_panel.clear()
+        self._trim_account_tabs(0)
@@ -9,19 +9,16 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLineEdit,
     QPushButton,
-    QListWidget,
-    QListWidgetItem,
     QSplitter,
-    QApplication,
+    QListView,
 )
 from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QCursor
 
 from language import t
 from .details_view import DetailsView
-from ..components.entry_list_item_widget import EntryListItemWidget
-from ..components.no_focus_delegate import NoFocusDelegate
-from ..components.custom_widgets import StyledListWidget
+from ..components.entry_list_model import EntryListModel
+from ..components.entry_item_delegate import EntryItemDelegate
+from ..components.custom_widgets import StyledListView
 from utils import icon_cache
 
 
@@ -33,13 +30,16 @@ class MainContentView(QWidget):
     主内容区域的视图组件。
     """
 
+    ENTRY_LIST_BATCH_SIZE = 100
+
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setObjectName("contentContainer")
 
         self.search_input: QLineEdit
         self.add_button: QPushButton
-        self.entry_list: StyledListWidget
+        self.entry_list: StyledListView
+        self.entry_model: EntryListModel
         self.details_view: DetailsView
 
         self.init_ui()
@@ -63,8 +63,17 @@ class MainContentView(QWidget):
         top_toolbar_layout.addWidget(self.add_button)
 
         inner_splitter = QSplitter(Qt.Orientation.Horizontal)
-        self.entry_list = StyledListWidget()
-        self.entry_list.setItemDelegate(NoFocusDelegate(self))
+        self.entry_model = EntryListModel(self)
+        self.entry_list = StyledListView()
+        # lists.qss 中的卡片样式只作用于条目列表，不影响下拉框等其他 QListView
+        self.entry_list.setObjectName("entryList")
+        self.entry_list.setModel(self.entry_model)
+        self.entry_list.setItemDelegate(EntryItemDelegate(self))
+        # 每一行的高度都相同，视图无需逐行询问尺寸
+        self.entry_list.setUniformItemSizes(True)
+        # 行数很多时分批完成布局，期间事件循环仍可处理输入和重绘
+        self.entry_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.entry_list.setBatchSize(self.ENTRY_LIST_BATCH_SIZE)
         self.details_view = DetailsView()
         inner_splitter.addWidget(self.entry_list)
         inner_splitter.addWidget(self.details_view)
@@ -76,48 +85,40 @@ class MainContentView(QWidget):
 
     def populate_entry_list(
         self,
+        sorted_names: List[str],
         entries_by_name: Dict[str, List[Dict[str, Any]]],
         current_selection: Optional[str],
     ) -> None:
-        self.entry_list.blockSignals(True)
-        self.entry_list.clear()
-
-        total_items = len(entries_by_name)
-        if total_items > 200:
-            QApplication.setOverrideCursor(QCursor(Qt.CursorShape.WaitCursor))
-
-        sorted_names = sorted(entries_by_name.keys())
-        item_to_select = None
-
-        for i, name in enumerate(sorted_names):
-            representative_entry = entries_by_name[name][0]
-            list_item = QListWidgetItem()
-            list_item.setData(Qt.ItemDataRole.UserRole, name)
-            list_item.setSizeHint(QSize(0, 48))
-            widget = EntryListItemWidget(representative_entry)
-            self.entry_list.addItem(list_item)
-            self.entry_list.setItemWidget(list_item, widget)
-            if name == current_selection:
-                item_to_select = list_item
-
-            if total_items > 200 and i % 100 == 0:
-                QApplication.processEvents()
-
-        if total_items > 200:
-            QApplication.restoreOverrideCursor()
-
-        self.entry_list.blockSignals(False)
-
-        if item_to_select:
-            self.entry_list.setCurrentItem(item_to_select)
-        elif self.entry_list.count() > 0:
-            self.entry_list.setCurrentRow(0)
+        """
+        用已按名称升序排列的名称列表刷新条目列表。排序由控制器负责，
+        它维护着按名称有序的条目索引，这里不再重复排序。
+        """
+        # 行数据直接保存在模型的 Python 列表中，无需为每一行创建 item 和小部件
+        rows = [(name, entries_by_name[name][0]) for name in sorted_names]
+
+        # 模型的增删信号可能有很多组，暂停重绘，全部更新完后只重绘一次
+        self.entry_list.setUpdatesEnabled(False)
+        try:
+            selection_model = self.entry_list.selectionModel()
+            selection_model.blockSignals(True)
+            try:
+                self.entry_model.set_rows(rows)
+            finally:
+                selection_model.blockSignals(False)
+
+            row_to_select = self.entry_model.row_of(current_selection)
+            if row_to_select < 0 and rows:
+                row_to_select = 0
+            if row_to_select >= 0:
+                self.entry_list.setCurrentIndex(self.entry_model.index(row_to_select))
+        finally:
+            self.entry_list.setUpdatesEnabled(True)
 
     def get_selected_entry_name(self) -> Optional[str]:
-        selected_items = self.entry_list.selectedItems()
-        return (
-            selected_items[0].data(Qt.ItemDataRole.UserRole) if selected_items else None
-        )
+        current_index = self.entry_list.currentIndex()
+        if not current_index.isValid():
+            return None
+        return self.entry_model.name_at(current_index.row())
 
     def retranslate_ui(self) -> None:
         self.search_input.setPlaceholderText(t.get("search_placeholder"))
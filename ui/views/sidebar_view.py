@@ -1,92 +1,94 @@
 # ui/views/sidebar_view.py
 
 import logging
-from typing import Optional, List, Dict
+from typing import Iterable, Optional, List, Dict, Union
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLayout, QLabel, QHBoxLayout, QStyle
-from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QEvent, QObject
-from PyQt6.QtGui import QPixmap, QShowEvent
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QHBoxLayout, QStyle
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer, QEvent
+from PyQt6.QtGui import QIcon, QPixmap, QShowEvent
 
 from language import t
 from core.icon_fetcher import IconFetcher
 from ..components.animated_bookmark_button import AnimatedBookmarkButton
-from utils import icon_cache, resource_path
+from utils import icon_cache
 
 logger = logging.getLogger(__name__)
 
 
 class SidebarView(QWidget):
     category_clicked = pyqtSignal(str)
+    # 窗口失活时发出，每个动画按钮在创建时连接到自己的 collapse 槽
+    _deactivated = pyqtSignal()
+
+    HOVER_RESYNC_DELAY_MS = 500
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
         self.setObjectName("sidebarContainer")
         self.category_buttons: dict[str, AnimatedBookmarkButton] = {}
-
-        self._filter_installed = False
+        # “全部”按钮和各个分类按钮在多次 populate_categories 之间复用，
+        # 分类按钮只在分类出现或消失时创建和释放，图标只在数据变化时更换
+        self._all_items_button: Optional[AnimatedBookmarkButton] = None
+        self._category_pool: Dict[str, AnimatedBookmarkButton] = {}
+        self._category_icon_data: Dict[str, Optional[str]] = {}
+        # 上一次构建分类按钮时的输入签名，内容未变时无需重建
+        self._categories_signature: Optional[tuple] = None
+        # 当前带有 active 属性的按钮，切换分类时只需重新计算新旧两个按钮的样式
+        self._active_button: Optional[AnimatedBookmarkButton] = None
+
+        self._shown_once = False
+        # 所有动画按钮（分类按钮在前），只在按钮集合变化时重建
+        self._all_buttons: List[AnimatedBookmarkButton] = []
+        # 正常情况下按钮依靠自身的 enter/leave 事件展开和收缩，无需轮询。
+        # 窗口重新激活（例如最小化后恢复）时可能错过这些事件，
+        # 因此在激活后稍等片刻做一次状态校正。
         self.hover_check_timer = QTimer(self)
-        self.hover_check_timer.setInterval(100)  # 每秒检查10次，响应迅速
-        self.hover_check_timer.timeout.connect(self._continuously_check_hover_states)
+        self.hover_check_timer.setSingleShot(True)
+        self.hover_check_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.hover_check_timer.setInterval(self.HOVER_RESYNC_DELAY_MS)
+        self.hover_check_timer.timeout.connect(self._check_hover_states)
 
         self.init_ui()
 
     def showEvent(self, a0: Optional[QShowEvent]) -> None:
-        """在控件首次显示时，为父窗口安装事件过滤器。"""
+        """控件首次显示时，如果窗口已经激活，则安排一次悬停状态校正。"""
         super().showEvent(a0)
-        if not self._filter_installed:
-            parent_window = self.window()
-            if parent_window:
-                parent_window.installEventFilter(self)
-                self._filter_installed = True
-                # 检查窗口是否已经激活，如果是，则立即启动定时器
-                if parent_window.isActiveWindow():
-                    self.hover_check_timer.start()
-
-    def eventFilter(self, a0: Optional[QObject], a1: Optional[QEvent]) -> bool:
+        if not self._shown_once:
+            self._shown_once = True
+            if self.isActiveWindow():
+                self.hover_check_timer.start()
+
+    def event(self, a0: Optional[QEvent]) -> bool:
         """
-        监听父窗口的激活/非激活事件，以启动/停止悬停状态检查定时器。
-        这是为了优化性能，仅在应用处于前台时才进行检查。
+        窗口激活状态变化时，QWidget::event 会把 WindowActivate/WindowDeactivate
+        转发给窗口内所有可见的子控件，因此侧边栏自己就能收到它们，
+        无需在整个窗口上安装事件过滤器（那样窗口的每个鼠标移动、绘制事件
+        都要经过一次 Python 回调）。激活后安排一次悬停状态校正，
+        失活时收缩所有按钮。
         """
-        # 增加对 None 的检查，以确保类型安全
-        if not a0 or not a1:
-            return super().eventFilter(a0, a1)
-
-        if a0 == self.window():
-            if a1.type() == QEvent.Type.WindowActivate:
-                if not self.hover_check_timer.isActive():
-                    self.hover_check_timer.start()
-            elif a1.type() == QEvent.Type.WindowDeactivate:
-                if self.hover_check_timer.isActive():
-                    self.hover_check_timer.stop()
-                    # 当窗口失活时，强制所有按钮收缩
-                    self._force_collapse_all()
-
-        return super().eventFilter(a0, a1)
-
-    def _get_all_buttons(self) -> List[AnimatedBookmarkButton]:
-        """获取侧边栏上所有动画按钮的列表。"""
-        return list(self.category_buttons.values()) + [
-            self.add_account_button,
-            self.generate_password_button,
-            self.settings_button,
-            self.minimize_button,
-            self.exit_button,
-        ]
-
-    def _continuously_check_hover_states(self) -> None:
+        if a0 is not None:
+            event_type = a0.type()
+            if event_type == QEvent.Type.WindowActivate:
+                self.hover_check_timer.start()
+            elif event_type == QEvent.Type.WindowDeactivate:
+                self.hover_check_timer.stop()
+                # 当窗口失活时，强制所有按钮收缩
+                self._deactivated.emit()
+        return super().event(a0)
+
+    def _rebuild_button_list(self) -> None:
+        """在分类按钮重建后刷新侧边栏上所有动画按钮的列表。"""
+        self._all_buttons = [*self.category_buttons.values(), *self._static_buttons]
+
+    def _check_hover_states(self) -> None:
         """
-        定时器触发时调用，遍历所有动画按钮，并调用它们的状态检查方法来强制同步UI。
+        窗口激活后由单次定时器调用，遍历所有动画按钮，
+        并调用它们的状态检查方法来强制同步UI。
         """
-        for button in self._get_all_buttons():
+        for button in self._all_buttons:
             if button.isVisible():
                 button.check_hover_state_and_correct()
 
-    def _force_collapse_all(self) -> None:
-        """当窗口失活时，强制收缩所有按钮。"""
-        for button in self._get_all_buttons():
-            if button.isVisible() and button.width() != button.compact_width:
-                button._collapse()
-
     def init_ui(self) -> None:
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 15, 0, 15)
@@ -99,38 +101,36 @@ class SidebarView(QWidget):
         logo_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         logo_label = QLabel()
-
-        logo_path = resource_path("images/icon-256.png")
-        pixmap = QPixmap(logo_path)
-
-        if pixmap.isNull():
-            logger.critical(
-                f"Failed to load logo for Sidebar from path: {logo_path}. Logo will be missing."
-            )
-        else:
-            if self.devicePixelRatio() > 1:
-                pixmap.setDevicePixelRatio(self.devicePixelRatio())
-
-            scaled_pixmap = pixmap.scaled(
-                48,
-                48,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            )
-            logo_label.setPixmap(scaled_pixmap)
+        logo_pixmap = icon_cache.get_logo_pixmap(48, self.devicePixelRatio())
+        if not logo_pixmap.isNull():
+            logo_label.setPixmap(logo_pixmap)
 
         logo_layout.addWidget(logo_label)
 
         self.category_buttons_layout = QVBoxLayout()
         self.category_buttons_layout.setSpacing(5)
 
-        self.add_account_button = AnimatedBookmarkButton(icon_cache.get("add"), "")
+        self.add_account_button = AnimatedBookmarkButton(self._button_pixmap("add"), "")
         self.generate_password_button = AnimatedBookmarkButton(
-            icon_cache.get("generate"), ""
+            self._button_pixmap("generate"), ""
+        )
+        self.settings_button = AnimatedBookmarkButton(
+            self._button_pixmap("settings"), ""
         )
-        self.settings_button = AnimatedBookmarkButton(icon_cache.get("settings"), "")
-        self.minimize_button = AnimatedBookmarkButton(icon_cache.get("minimize"), "")
-        self.exit_button = AnimatedBookmarkButton(icon_cache.get("exit"), "")
+        self.minimize_button = AnimatedBookmarkButton(
+            self._button_pixmap("minimize"), ""
+        )
+        self.exit_button = AnimatedBookmarkButton(self._button_pixmap("exit"), "")
+        self._static_buttons = (
+            self.add_account_button,
+            self.generate_password_button,
+            self.settings_button,
+            self.minimize_button,
+            self.exit_button,
+        )
+        for button in self._static_buttons:
+            self._deactivated.connect(button.collapse)
+        self._rebuild_button_list()
 
         main_layout.addWidget(logo_container)
         main_layout.addLayout(self.category_buttons_layout)
@@ -144,50 +144,123 @@ class SidebarView(QWidget):
 
         self.retranslate_ui()
 
-    def _clear_layout(self, layout: QLayout):
-        while layout.count():
-            child = layout.takeAt(0)
-            if child:
-                widget = child.widget()
-                if widget:
-                    widget.deleteLater()
+    def _button_pixmap(self, key: str) -> QPixmap:
+        # 使用预先光栅化好的图标，按钮创建时无需再渲染SVG
+        return icon_cache.get_pixmap(
+            key, AnimatedBookmarkButton.ICON_SIZE.width(), self.devicePixelRatio()
+        )
+
+    def _release_widgets(self, widgets: Iterable[QWidget]) -> None:
+        # 移除的控件全部挂到一个不可见的临时容器下，最后只对容器调用一次
+        # deleteLater，所有子控件随容器一起释放，只产生一个延迟删除事件
+        graveyard = QWidget()
+        for widget in widgets:
+            self.category_buttons_layout.removeWidget(widget)
+            # 换到未显示的父控件下，控件会立即从界面中消失
+            widget.setParent(graveyard)
+        graveyard.deleteLater()
+
+    def _category_icon(self, icon_data: Optional[str]) -> Union[QIcon, QPixmap]:
+        if icon_data:
+            return IconFetcher.icon_from_base64(icon_data)
+        return self._button_pixmap("folder")
+
+    def _new_category_button(
+        self, icon_source: Union[QIcon, QPixmap], text: str
+    ) -> AnimatedBookmarkButton:
+        button = AnimatedBookmarkButton(icon_source, text)
+        button.setProperty("categoryName", text)
+        button.clicked.connect(self._on_category_button_clicked)
+        self._deactivated.connect(button.collapse)
+        return button
 
     def populate_categories(
         self, categories: List[str], icon_map: Dict[str, str]
     ) -> None:
-        self._clear_layout(self.category_buttons_layout)
-        self.category_buttons.clear()
-
+        # 编辑或删除条目后通常分类集合不变，此时保留现有按钮
         all_items_text = t.get("all_categories")
-        all_items_button = AnimatedBookmarkButton(
-            icon_cache.get("list"), all_items_text
-        )
-        all_items_button.clicked.connect(
-            lambda: self.category_clicked.emit(all_items_text)
+        signature = (
+            all_items_text,
+            tuple(categories),
+            tuple(icon_map.get(name) for name in categories),
         )
-        self.category_buttons[all_items_text] = all_items_button
-        self.category_buttons_layout.addWidget(all_items_button)
-
-        for category_name in categories:
-            icon = (
-                IconFetcher.icon_from_base64(icon_map.get(category_name))
-                if icon_map.get(category_name)
-                else icon_cache.get("folder")
-            )
-            button = AnimatedBookmarkButton(icon, category_name)
-            button.clicked.connect(
-                lambda checked=False, name=category_name: self.category_clicked.emit(
-                    name
+        if signature == self._categories_signature:
+            return
+        self._categories_signature = signature
+
+        # 更新按钮期间暂停重绘，结束后统一刷新一次
+        self.setUpdatesEnabled(False)
+        try:
+            all_items_button = self._all_items_button
+            if all_items_button is None:
+                all_items_button = self._new_category_button(
+                    self._button_pixmap("list"), all_items_text
                 )
-            )
-            self.category_buttons[category_name] = button
-            self.category_buttons_layout.addWidget(button)
+                self._all_items_button = all_items_button
+            elif all_items_button.property("categoryName") != all_items_text:
+                # 切换语言后只需更新文字
+                all_items_button.text_label.setText(all_items_text)
+                all_items_button.setProperty("categoryName", all_items_text)
+
+            # 只释放已经消失的分类的按钮
+            wanted = set(categories)
+            stale = [name for name in self._category_pool if name not in wanted]
+            if stale:
+                self._release_widgets(self._category_pool.pop(name) for name in stale)
+                for name in stale:
+                    del self._category_icon_data[name]
+
+            ordered = [all_items_button]
+            for category_name in categories:
+                icon_data = icon_map.get(category_name)
+                button = self._category_pool.get(category_name)
+                if button is None:
+                    button = self._new_category_button(
+                        self._category_icon(icon_data), category_name
+                    )
+                    self._category_pool[category_name] = button
+                    self._category_icon_data[category_name] = icon_data
+                elif self._category_icon_data[category_name] != icon_data:
+                    button.set_icon(self._category_icon(icon_data))
+                    self._category_icon_data[category_name] = icon_data
+                ordered.append(button)
+
+            # 按新的顺序重新排列布局；控件本身保持不变，只是调整位置
+            layout = self.category_buttons_layout
+            current = [layout.itemAt(i).widget() for i in range(layout.count())]
+            if current != ordered:
+                while layout.count():
+                    layout.takeAt(0)
+                for button in ordered:
+                    layout.addWidget(button)
+
+            self.category_buttons = {all_items_text: all_items_button}
+            self.category_buttons.update(self._category_pool)
+            if self._active_button is not None and self._active_button not in ordered:
+                self._active_button = None
+        finally:
+            self._rebuild_button_list()
+            self.setUpdatesEnabled(True)
+
+    def _on_category_button_clicked(self) -> None:
+        # 所有分类按钮共用这一个槽，分类名称保存在按钮的动态属性中
+        button = self.sender()
+        if button is not None:
+            self.category_clicked.emit(button.property("categoryName"))
 
     def set_active_category(self, active_category_name: str) -> None:
-        for name, button in self.category_buttons.items():
-            is_active = name == active_category_name
+        new_button = self.category_buttons.get(active_category_name)
+        old_button = self._active_button
+        if new_button is old_button:
+            return
+        self._active_button = new_button
+
+        # 新建的按钮没有 active 属性，等同于未激活，因此只有这两个按钮的
+        # 状态发生了变化，其余按钮无需重新应用样式表
+        for button, is_active in ((old_button, False), (new_button, True)):
+            if button is None:
+                continue
             button.setProperty("active", is_active)
-
             style = button.style()
             if style:
                 style.unpolish(button)
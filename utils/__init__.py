@@ -3,3 +3,4 @@
 from .paths import resource_path
 from .clipboard import clipboard_manager
 from .icon_cache import icon_cache
+from .password_policy import is_password_strong
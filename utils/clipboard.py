@@ -1,8 +1,13 @@
 # utils/clipboard.py
 
+import hashlib
+import hmac
 import logging
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
+from typing import TYPE_CHECKING
+
+# Qt 模块在真正使用剪贴板时才导入，导入 utils 包不会连带加载 QtWidgets
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QTimer
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +20,13 @@ class ClipboardManager:
     """
     SENSITIVE_DATA_TIMEOUT_MS = 30000  # 30秒
 
+    # 所有敏感复制共享同一个单次定时器，每次复制时重新启动，
+    # 而不是为每次复制都创建一个携带闭包的新定时器。
+    _clear_timer: "QTimer | None" = None
+    # 只保存最后一次敏感复制内容的摘要，而不是明文本身，
+    # 避免密码在定时器触发前一直留在内存中
+    _last_sensitive_digest: bytes | None = None
+
     @staticmethod
     def copy(text: str, is_sensitive: bool = False) -> None:
         """
@@ -24,6 +36,8 @@ class ClipboardManager:
             text: 要复制的文本字符串。
             is_sensitive: 如果为 True，则在设定的超时时间后自动清理剪贴板。
         """
+        from PyQt6.QtWidgets import QApplication
+
         clipboard = QApplication.clipboard()
         if not clipboard:
             logger.warning("QApplication clipboard is not available.")
@@ -33,21 +47,50 @@ class ClipboardManager:
         
         if is_sensitive:
             logger.debug(f"Sensitive data copied to clipboard. Will clear in {ClipboardManager.SENSITIVE_DATA_TIMEOUT_MS / 1000} seconds.")
-            # 使用单次定时器在超时后检查并清理剪贴板
-            QTimer.singleShot(
-                ClipboardManager.SENSITIVE_DATA_TIMEOUT_MS,
-                lambda: ClipboardManager._clear_if_matches(text)
+            ClipboardManager._last_sensitive_digest = ClipboardManager._digest(text)
+            # 重新启动共享定时器，超时后检查并清理剪贴板
+            ClipboardManager._get_clear_timer().start(
+                ClipboardManager.SENSITIVE_DATA_TIMEOUT_MS
             )
 
     @staticmethod
-    def _clear_if_matches(original_text: str) -> None:
+    def _get_clear_timer() -> "QTimer":
+        """延迟创建共享的单次定时器（需要在 QApplication 创建之后）。"""
+        if ClipboardManager._clear_timer is None:
+            from PyQt6.QtCore import Qt, QTimer
+
+            timer = QTimer()
+            timer.setSingleShot(True)
+            # 明确使用粗粒度定时器，清理时机不需要精确到毫秒
+            timer.setTimerType(Qt.TimerType.CoarseTimer)
+            timer.timeout.connect(ClipboardManager._clear_if_matches)
+            ClipboardManager._clear_timer = timer
+        return ClipboardManager._clear_timer
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    @staticmethod
+    def _clear_if_matches() -> None:
         """
         这是一个私有辅助方法，用于在定时器触发时执行清理操作。
-        它会检查剪贴板当前的内容是否仍是当初复制的敏感信息，
+        它会检查剪贴板当前的内容是否仍是最后一次复制的敏感信息，
         如果是，则清空；如果用户已经复制了其他内容，则不进行任何操作。
         """
+        original_digest = ClipboardManager._last_sensitive_digest
+        ClipboardManager._last_sensitive_digest = None
+        if original_digest is None:
+            return
+
+        from PyQt6.QtWidgets import QApplication
+
         clipboard = QApplication.clipboard()
-        if clipboard and clipboard.text() == original_text:
+        if not clipboard:
+            return
+        # 两个摘要长度固定，用常数时间比较，不泄露内容的相似程度
+        current_digest = ClipboardManager._digest(clipboard.text())
+        if hmac.compare_digest(current_digest, original_digest):
             clipboard.clear()
             logger.info("Clipboard cleared of sensitive data after timeout.")
 
@@ -1,121 +1,214 @@
 # utils/icon_cache.py
 
 import logging
-from typing import Dict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from PyQt6.QtGui import QIcon
-from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QIcon, QImage, QPainter, QPixmap, QPixmapCache
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtSvg import QSvgRenderer
 
 from .paths import resource_path
 
 logger = logging.getLogger(__name__)
 
+# 缓存未命中的标记，让 get() 只需一次字典查找
+_MISS = object()
 
-class IconCache:
+# 后台渲染结果: 图标键 -> [(逻辑尺寸, 设备像素比, 图像)]
+_RenderedIcons = Dict[str, List[Tuple[int, float, QImage]]]
+
+
+def _render_svg_images(
+    icons: Dict[str, str], sizes: Tuple[Tuple[int, float], ...]
+) -> _RenderedIcons:
     """
-    一个单例，用于在程序启动时预加载和缓存常用图标。
-    这可以防止在首次使用图标（如按钮悬停）时因即时加载资源而导致的UI卡顿。
+    在工作线程中把SVG图标光栅化为 QImage。
+    QPixmap 只能在主线程中使用，而 QImage 和 QSvgRenderer 可以在任意线程中使用。
     """
+    rendered: _RenderedIcons = {}
+    for key, path in icons.items():
+        renderer = QSvgRenderer(path)
+        if not renderer.isValid():
+            logger.warning(f"Failed to render icon '{key}' from path: {path}.")
+            continue
+
+        images = []
+        for size, dpr in sizes:
+            pixel_size = round(size * dpr)
+            image = QImage(
+                pixel_size, pixel_size, QImage.Format.Format_ARGB32_Premultiplied
+            )
+            image.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(image)
+            renderer.render(painter)
+            painter.end()
+            images.append((size, dpr, image))
+        rendered[key] = images
+    return rendered
 
-    _instance = None
 
-    # --- MODIFICATION START: Pre-declare instance attributes at class level ---
-    # 在类的顶层声明实例属性及其类型。
-    # 这让 Pylance 等静态分析器能够识别 _cache 和 _initialized 属性。
-    _cache: Dict[str, QIcon]
-    _initialized: bool
-    # --- MODIFICATION END ---
+class IconCache:
+    """
+    在程序启动时预加载和缓存常用图标。
+    这可以防止在首次使用图标（如按钮悬停）时因即时加载资源而导致的UI卡顿。
+    全局唯一的实例是本模块底部的 icon_cache，模块导入本身保证只创建一次，
+    因此不需要在 __new__ 中实现单例逻辑。
+    """
 
     # 定义所有需要预加载的图标的键和路径
-    PRELOAD_ICONS = {
-        "user_edit": "ui/assets/icons/user_edit.svg",
-        "add": "ui/assets/icons/add.svg",
-        "generate": "ui/assets/icons/generate.svg",
-        "settings": "ui/assets/icons/settings.svg",
-        "minimize": "ui/assets/icons/minimize.svg",
-        "exit": "ui/assets/icons/exit.svg",
-        "list": "ui/assets/icons/list.svg",
-        "folder": "ui/assets/icons/folder.svg",
-        "edit": "ui/assets/icons/edit.svg",
-        "delete": "ui/assets/icons/delete.svg",
-        "copy": "ui/assets/icons/copy.svg",
-        "import": "ui/assets/icons/import.svg",
-        "export": "ui/assets/icons/export.svg",
-        "chevron-down": "ui/assets/icons/chevron-down.svg",
+    PRELOAD_ICONS: Tuple[Tuple[str, str], ...] = (
+        ("user_edit", "ui/assets/icons/user_edit.svg"),
+        ("add", "ui/assets/icons/add.svg"),
+        ("generate", "ui/assets/icons/generate.svg"),
+        ("settings", "ui/assets/icons/settings.svg"),
+        ("minimize", "ui/assets/icons/minimize.svg"),
+        ("exit", "ui/assets/icons/exit.svg"),
+        ("list", "ui/assets/icons/list.svg"),
+        ("folder", "ui/assets/icons/folder.svg"),
+        ("edit", "ui/assets/icons/edit.svg"),
+        ("delete", "ui/assets/icons/delete.svg"),
+        ("copy", "ui/assets/icons/copy.svg"),
+        ("import", "ui/assets/icons/import.svg"),
+        ("export", "ui/assets/icons/export.svg"),
+        ("chevron-down", "ui/assets/icons/chevron-down.svg"),
+    )
+    # 绝对路径在类定义时一次性解析好，preload() 和即时加载时直接使用
+    _ICON_PATHS: Dict[str, str] = {
+        key: resource_path(path) for key, path in PRELOAD_ICONS
     }
 
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(IconCache, cls).__new__(cls)
-            # --- MODIFICATION START: Initialize a flag for __init__ ---
-            # 标记实例为“未初始化”
-            cls._instance._initialized = False
-            # --- MODIFICATION END ---
-            logger.info("IconCache instance created.")
-        return cls._instance
-
-    # --- MODIFICATION START: Use __init__ for initialization ---
-    # __init__ 用于初始化实例。我们添加一个检查，确保它只运行一次。
-    def __init__(self):
-        if self._initialized:
-            return
-        self._cache = {}
-        self._initialized = True
+    LOGO_PATH = "images/icon-256.png"
+
+    # 预先光栅化的 (逻辑尺寸, 设备像素比) 组合。22 是按钮图标的尺寸，
+    # 32 是对话框等处使用的较大尺寸；2.0 覆盖常见的高分屏。
+    PRELOAD_PIXMAP_SIZES = ((22, 1.0), (22, 2.0), (32, 1.0), (32, 2.0))
 
-    # --- MODIFICATION END ---
+    def __init__(self):
+        self._cache: Dict[str, QIcon] = {}
+        self._logo_cache: Dict[Tuple[int, float], QPixmap] = {}
 
-    def preload(self) -> None:
+    def preload(
+        self, run_in_background: Optional[Callable[..., Any]] = None
+    ) -> None:
         """
         加载所有在 PRELOAD_ICONS 中定义的图标并缓存它们。
         这个方法应该在程序启动的早期被调用。
+
+        QIcon 本身只记录文件路径，创建很快；真正耗时的SVG解析和光栅化
+        交给调用方提供的 run_in_background（签名同 TaskManager.run_in_background）
+        在后台线程完成，结果回到主线程后再转换为 QPixmap 放入 QPixmapCache。
+        在此之前请求的图标会由 get_pixmap 即时渲染，行为不受影响。
+        未提供 run_in_background 时在当前线程同步渲染。
         """
         logger.info("Preloading all application icons...")
-        count = 0
-        for key, path in self.PRELOAD_ICONS.items():
-            try:
-                # 创建 QIcon 对象
-                icon = QIcon(resource_path(path))
-
-                # 关键步骤: 调用 pixmap() 强制Qt立即渲染SVG到光栅图像
-                if not icon.isNull():
-                    icon.pixmap(QSize(32, 32))  # 使用一个典型尺寸强制渲染
-                    self._cache[key] = icon
-                    count += 1
-                else:
-                    logger.warning(
-                        f"Failed to preload icon '{key}' from path: {path}. Icon is null."
-                    )
-
-            except Exception as e:
-                logger.error(
-                    f"Error preloading icon '{key}' from path {path}: {e}",
-                    exc_info=True,
+        paths: Dict[str, str] = {}
+        for key, path in self._ICON_PATHS.items():
+            icon = QIcon(path)
+            if icon.isNull():
+                logger.warning(
+                    f"Failed to preload icon '{key}' from path: {path}. Icon is null."
                 )
+                continue
+            self._cache[key] = icon
+            paths[key] = path
+
+        if run_in_background is None:
+            self._on_icons_rendered(
+                _render_svg_images(paths, self.PRELOAD_PIXMAP_SIZES)
+            )
+            return
+
+        run_in_background(
+            _render_svg_images,
+            self._on_icons_rendered,
+            lambda e: logger.error(f"Error preloading icons: {e}", exc_info=e),
+            icons=paths,
+            sizes=self.PRELOAD_PIXMAP_SIZES,
+        )
+
+    def _on_icons_rendered(self, rendered: _RenderedIcons) -> None:
+        """在主线程中把后台渲染好的 QImage 转换为 QPixmap 并放入缓存。"""
+        for key, images in rendered.items():
+            for size, dpr, image in images:
+                cache_key = self._pixmap_cache_key(key, size, dpr)
+                # 渲染完成前可能已被 get_pixmap 即时生成，不再覆盖
+                if QPixmapCache.find(cache_key) is not None:
+                    continue
+                pixmap = QPixmap.fromImage(image)
+                pixmap.setDevicePixelRatio(dpr)
+                QPixmapCache.insert(cache_key, pixmap)
 
         logger.info(
-            f"Successfully preloaded and cached {count}/{len(self.PRELOAD_ICONS)} icons."
+            f"Successfully preloaded and cached {len(rendered)}/{len(self.PRELOAD_ICONS)} icons."
         )
 
     def get(self, key: str) -> QIcon:
         """
         从缓存中获取一个 QIcon。
         """
-        # 现在 Pylance 可以正确识别 self._cache 了
-        if key not in self._cache:
-            logger.warning(
-                f"Icon key '{key}' not found in cache. Attempting to load just-in-time."
+        icon = self._cache.get(key, _MISS)
+        if icon is _MISS:
+            return self._load_jit(key)
+        return icon
+
+    def _load_jit(self, key: str) -> QIcon:
+        """缓存未命中时的回退路径：即时加载图标并放入缓存。"""
+        logger.warning(
+            f"Icon key '{key}' not found in cache. Attempting to load just-in-time."
+        )
+        path = self._ICON_PATHS.get(key)
+        if path:
+            icon = QIcon(path)
+            if not icon.isNull():
+                self._cache[key] = icon
+                return icon
+        return QIcon()  # 返回一个空图标
+
+    def get_pixmap(self, key: str, size: int, dpr: float) -> QPixmap:
+        """
+        获取指定图标在给定逻辑尺寸和设备像素比下的光栅图像。
+        结果以 (键, 尺寸, 设备像素比) 为键保存在 QPixmapCache 中。
+        """
+        cache_key = self._pixmap_cache_key(key, size, dpr)
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None:
+            pixmap = self.get(key).pixmap(QSize(size, size), dpr)
+            QPixmapCache.insert(cache_key, pixmap)
+        return pixmap
+
+    @staticmethod
+    def _pixmap_cache_key(key: str, size: int, dpr: float) -> str:
+        return f"icon:{key}@{size}x{dpr}"
+
+    def get_logo_pixmap(self, size: int, dpr: float) -> QPixmap:
+        """
+        获取缩放到指定尺寸的应用Logo。解码PNG和平滑缩放只在每种
+        (尺寸, 设备像素比) 组合第一次请求时执行一次。
+        加载失败时返回空的 QPixmap。
+        """
+        key = (size, dpr)
+        cached = self._logo_cache.get(key)
+        if cached is not None:
+            return cached
+
+        logo_path = resource_path(self.LOGO_PATH)
+        pixmap = QPixmap(logo_path)
+        if pixmap.isNull():
+            logger.critical(
+                f"Failed to load logo from path: {logo_path}. Logo will be missing."
             )
-            path = self.PRELOAD_ICONS.get(key)
-            if path:
-                # 作为回退，即时加载并放入缓存
-                icon = QIcon(resource_path(path))
-                if not icon.isNull():
-                    icon.pixmap(QSize(32, 32))
-                    self._cache[key] = icon
-                    return icon
-            return QIcon()  # 返回一个空图标
-
-        return self._cache[key]
+            return pixmap
+
+        if dpr > 1:
+            pixmap.setDevicePixelRatio(dpr)
+        scaled_pixmap = pixmap.scaled(
+            size,
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        self._logo_cache[key] = scaled_pixmap
+        return scaled_pixmap
 
 
 # 创建一个全局实例供整个应用程序使用
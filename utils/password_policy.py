@@ -0,0 +1,45 @@
+# utils/password_policy.py
+
+MIN_PASSWORD_LENGTH = 8
+
+# 字符类别的位标记：大写字母、小写字母、数字
+_UPPER = 1
+_LOWER = 2
+_DIGIT = 4
+_ALL_CLASSES = _UPPER | _LOWER | _DIGIT
+
+
+def _char_class(c: str) -> int:
+    if c.isupper():
+        return _UPPER
+    if c.islower():
+        return _LOWER
+    if c.isdigit():
+        return _DIGIT
+    return 0
+
+
+# ASCII 字符的类别查找表，常见密码字符只需一次下标访问即可分类
+_ASCII_CLASSES = bytes(_char_class(chr(i)) for i in range(128))
+
+
+def is_password_strong(password: str) -> bool:
+    """
+    检查主密码是否满足强度要求：至少 8 位，且同时包含大写字母、
+    小写字母和数字。
+
+    只遍历一次字符串，用位标记记录已出现的字符类别，三类齐全时立即返回，
+    而不是分别用三个 any() 各扫描一遍。ASCII 字符通过查找表分类，
+    其他 Unicode 字符仍按 str 的方法判断，结果与原规则一致。
+    """
+    if len(password) < MIN_PASSWORD_LENGTH:
+        return False
+
+    flags = 0
+    ascii_classes = _ASCII_CLASSES
+    for c in password:
+        code = ord(c)
+        flags |= ascii_classes[code] if code < 128 else _char_class(c)
+        if flags == _ALL_CLASSES:
+            return True
+    return False
@@ -2,13 +2,14 @@
 
 import sys
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Union
 
 
-def resource_path(relative_path: Union[str, Path]) -> str:
+def _get_base_path() -> Path:
     """
-    获取资源的绝对路径，无论是从源码运行还是从打包后的可执行文件运行。
+    确定资源的基础目录。
 
     这是与 PyInstaller 等打包工具集成的关键函数。
     """
@@ -20,12 +21,29 @@ def resource_path(relative_path: Union[str, Path]) -> str:
         # 这种方式对静态代码分析工具 (如 Pylance) 是友好的，
         # 因为它明确表示了这是一次运行时属性查找，从而避免了报错。
         meipass_path = getattr(sys, "_MEIPASS")
-        base_path = Path(meipass_path)
+        return Path(meipass_path)
         # --- MODIFICATION END ---
-    else:
-        # 在正常的源码环境中运行
-        # 假设此文件在 utils/ 目录下，项目的根目录是上一级目录
-        base_path = Path(__file__).resolve().parent.parent
 
+    # 在正常的源码环境中运行
+    # 假设此文件在 utils/ 目录下，项目的根目录是上一级目录
+    return Path(__file__).resolve().parent.parent
+
+
+# 基础目录在进程运行期间不会改变，导入时计算一次，
+# 之后解析路径不再需要 Path.resolve() 的文件系统调用
+_BASE_PATH = str(_get_base_path())
+
+
+def resource_path(relative_path: Union[str, Path]) -> str:
+    """
+    获取资源的绝对路径，无论是从源码运行还是从打包后的可执行文件运行。
+    """
+    # str 和 Path 形式的同一路径共用一个缓存项
+    return _resolve_resource_path(str(relative_path))
+
+
+# 资源路径的集合很小且固定，解析结果可以安全地缓存
+@lru_cache(maxsize=512)
+def _resolve_resource_path(relative_path: str) -> str:
     # 使用 os.path.join 确保跨平台兼容性
-    return str(os.path.join(base_path, str(relative_path)))
+    return os.path.join(_BASE_PATH, relative_path)